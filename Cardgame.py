@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
+from running_stats import RunningStats
+
 
 class Card:
     """Represents a playing card with suit and rank"""
@@ -149,6 +151,7 @@ class Game:
         self.player_wins = 0
         self.dealer_wins = 0
         self.rounds_played = 0
+        self.stats = RunningStats()  # Streaming rates and confidence intervals
 
     def start_new_round(self):
         """Start a new round of the game"""
@@ -177,6 +180,7 @@ class Game:
                 self.result = "win"
                 self.player_wins += 1
             self.rounds_played += 1
+            self.stats.add_round(self.result)
         else:
             self.game_state = "player_turn"
             self.result = None
@@ -195,6 +199,7 @@ class Game:
             self.result = "lose"
             self.dealer_wins += 1
             self.rounds_played += 1
+            self.stats.add_round(self.result)
             self.dealer_hand.reveal_hidden_card()
             return False
 
@@ -217,6 +222,7 @@ class Game:
         self.game_state = "finished"
         self.determine_winner()
         self.rounds_played += 1
+        self.stats.add_round(self.result)
 
     def determine_winner(self):
         """Determine the winner of the round"""
@@ -248,6 +254,14 @@ class CardWidget(QWidget):
         self.is_hidden = is_hidden
         self.setFixedSize(80, 120)
 
+    def set_card(self, card=None, is_hidden=False):
+        """Show a different card, repainting only if it changed"""
+        if card is self.card and is_hidden == self.is_hidden:
+            return
+        self.card = card
+        self.is_hidden = is_hidden
+        self.update()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -555,6 +569,7 @@ class GameWindow(QMainWindow):
         dealer_layout.addWidget(self.dealer_total_label)
 
         self.dealer_cards_layout = QHBoxLayout()
+        self.dealer_card_widgets = []
         dealer_layout.addLayout(self.dealer_cards_layout)
         dealer_group.setLayout(dealer_layout)
 
@@ -585,6 +600,7 @@ class GameWindow(QMainWindow):
         player_layout.addWidget(self.player_total_label)
 
         self.player_cards_layout = QHBoxLayout()
+        self.player_card_widgets = []
         player_layout.addLayout(self.player_cards_layout)
         player_group.setLayout(player_layout)
 
@@ -662,118 +678,130 @@ class GameWindow(QMainWindow):
         return controls
 
     def update_ui(self):
-        """Update the UI based on game state"""
+        """Update the UI based on game state, touching only what changed since the last update"""
         # Update scores
-        self.player_score_label.setText(f"Player: {self.game.player_wins}")
-        self.dealer_score_label.setText(f"Dealer: {self.game.dealer_wins}")
-        self.rounds_label.setText(f"Rounds: {self.game.rounds_played}")
-
-        # Clear card layouts
-        self.clear_layout(self.player_cards_layout)
-        self.clear_layout(self.dealer_cards_layout)
+        self.set_label_text(self.player_score_label, f"Player: {self.game.player_wins}")
+        self.set_label_text(self.dealer_score_label, f"Dealer: {self.game.dealer_wins}")
+        self.set_label_text(self.rounds_label, f"Rounds: {self.game.rounds_played}")
 
         # Display player cards
         player_value = self.game.player_hand.calculate_value()
-        self.player_total_label.setText(f"Total: {player_value}")
-
-        for card in self.game.player_hand.cards:
-            card_widget = CardWidget(card)
-            self.player_cards_layout.addWidget(card_widget)
+        self.set_label_text(self.player_total_label, f"Total: {player_value}")
+        self.reconcile_cards(self.player_cards_layout, self.player_card_widgets,
+                             [(card, False) for card in self.game.player_hand.cards])
 
         # Display dealer cards
         if self.game.game_state == "finished" or self.game.game_state == "dealer_turn":
             dealer_value = self.game.dealer_hand.calculate_value()
-            self.dealer_total_label.setText(f"Total: {dealer_value}")
+            self.set_label_text(self.dealer_total_label, f"Total: {dealer_value}")
 
-            # Show all dealer cards
-            for card in self.game.dealer_hand.cards:
-                card_widget = CardWidget(card)
-                self.dealer_cards_layout.addWidget(card_widget)
+            # Show all dealer cards; the hidden card's widget is turned face up
+            dealer_cards = [(card, False) for card in self.game.dealer_hand.cards]
         else:
-            self.dealer_total_label.setText("Total: --")
+            self.set_label_text(self.dealer_total_label, "Total: --")
 
             # Show dealer cards with one hidden
-            if self.game.dealer_hand.cards:
-                card_widget = CardWidget(self.game.dealer_hand.cards[0])
-                self.dealer_cards_layout.addWidget(card_widget)
-
+            dealer_cards = [(card, False) for card in self.game.dealer_hand.cards[:1]]
             if self.game.dealer_hand.face_down_card:
-                hidden_widget = CardWidget(is_hidden=True)
-                self.dealer_cards_layout.addWidget(hidden_widget)
+                dealer_cards.append((None, True))
+        self.reconcile_cards(self.dealer_cards_layout, self.dealer_card_widgets, dealer_cards)
 
         # Update button states
         if self.game.game_state == "player_turn":
-            self.hit_button.setEnabled(True)
-            self.stand_button.setEnabled(True)
-            self.new_round_button.setEnabled(False)
-            self.result_label.setText("Your turn - Hit or Stand?")
-            self.status_bar.showMessage("Your turn. Click Hit to draw a card or Stand to end your turn.")
+            self.set_buttons_enabled(hit=True, stand=True, new_round=False)
+            self.set_label_text(self.result_label, "Your turn - Hit or Stand?")
+            self.show_status("Your turn. Click Hit to draw a card or Stand to end your turn.")
         elif self.game.game_state == "dealer_turn":
-            self.hit_button.setEnabled(False)
-            self.stand_button.setEnabled(False)
-            self.new_round_button.setEnabled(False)
-            self.result_label.setText("Dealer's turn...")
-            self.status_bar.showMessage("Dealer's turn. The dealer will draw cards until reaching 17 or more.")
+            self.set_buttons_enabled(hit=False, stand=False, new_round=False)
+            self.set_label_text(self.result_label, "Dealer's turn...")
+            self.show_status("Dealer's turn. The dealer will draw cards until reaching 17 or more.")
         elif self.game.game_state == "finished":
-            self.hit_button.setEnabled(False)
-            self.stand_button.setEnabled(False)
-            self.new_round_button.setEnabled(True)
+            self.set_buttons_enabled(hit=False, stand=False, new_round=True)
 
             # Display result
             if self.game.result == "win":
-                self.result_label.setText("You Win! 🎉")
-                self.status_bar.showMessage("Congratulations! You won this round.")
+                self.set_label_text(self.result_label, "You Win! 🎉")
+                self.show_status("Congratulations! You won this round.")
             elif self.game.result == "lose":
-                self.result_label.setText("Dealer Wins 💔")
-                self.status_bar.showMessage("Dealer won this round. Better luck next time!")
+                self.set_label_text(self.result_label, "Dealer Wins 💔")
+                self.show_status("Dealer won this round. Better luck next time!")
             else:  # push
-                self.result_label.setText("Push (Tie) 🤝")
-                self.status_bar.showMessage("It's a tie! The round ends in a push.")
+                self.set_label_text(self.result_label, "Push (Tie) 🤝")
+                self.show_status("It's a tie! The round ends in a push.")
         else:  # idle
-            self.hit_button.setEnabled(False)
-            self.stand_button.setEnabled(False)
-            self.new_round_button.setEnabled(True)
-            self.result_label.setText("Click 'New Round' to start!")
+            self.set_buttons_enabled(hit=False, stand=False, new_round=True)
+            self.set_label_text(self.result_label, "Click 'New Round' to start!")
 
         # Apply current theme colors to result label
         if hasattr(self, 'theme_button') and self.theme_button.isChecked():
             # Dark theme is active
             if self.game.result == "win":
-                self.result_label.setStyleSheet("color: #4CAF50; padding: 10px;")
+                color = "#4CAF50"
             elif self.game.result == "lose":
-                self.result_label.setStyleSheet("color: #F44336; padding: 10px;")
+                color = "#F44336"
             elif self.game.result == "push":
-                self.result_label.setStyleSheet("color: #9E9E9E; padding: 10px;")
+                color = "#9E9E9E"
             elif self.game.game_state == "player_turn":
-                self.result_label.setStyleSheet("color: #64B5F6; padding: 10px;")
+                color = "#64B5F6"
             elif self.game.game_state == "dealer_turn":
-                self.result_label.setStyleSheet("color: #FFB74D; padding: 10px;")
+                color = "#FFB74D"
             else:
-                self.result_label.setStyleSheet("color: #E0E0E0; padding: 10px;")
+                color = "#E0E0E0"
         else:
             # Light theme is active
             if self.game.result == "win":
-                self.result_label.setStyleSheet("color: #27AE60; padding: 10px;")
+                color = "#27AE60"
             elif self.game.result == "lose":
-                self.result_label.setStyleSheet("color: #E74C3C; padding: 10px;")
+                color = "#E74C3C"
             elif self.game.result == "push":
-                self.result_label.setStyleSheet("color: #7F8C8D; padding: 10px;")
+                color = "#7F8C8D"
             elif self.game.game_state == "player_turn":
-                self.result_label.setStyleSheet("color: #3498DB; padding: 10px;")
+                color = "#3498DB"
             elif self.game.game_state == "dealer_turn":
-                self.result_label.setStyleSheet("color: #E67E22; padding: 10px;")
+                color = "#E67E22"
             else:
-                self.result_label.setStyleSheet("color: #2C3E50; padding: 10px;")
-
-        # Force UI update
-        self.update()
-
-    def clear_layout(self, layout):
-        """Clear all widgets from a layout"""
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+                color = "#2C3E50"
+        style = f"color: {color}; padding: 10px;"
+        # Setting a style sheet re-polishes the label, so only do it when the color changes
+        if self.result_label.styleSheet() != style:
+            self.result_label.setStyleSheet(style)
+
+    def reconcile_cards(self, layout, widgets, cards):
+        """Make a row of card widgets show the given (card, is_hidden) pairs
+
+        Widgets already showing the right card are left alone, changed ones are rebound
+        (which is how the dealer's hidden card is revealed), missing ones are added and
+        leftover ones are hidden and kept for the next round.
+        """
+        for index, (card, is_hidden) in enumerate(cards):
+            if index < len(widgets):
+                widgets[index].set_card(card, is_hidden)
+                if widgets[index].isHidden():
+                    widgets[index].show()
+            else:
+                widget = CardWidget(card, is_hidden)
+                layout.addWidget(widget)
+                widgets.append(widget)
+        for widget in widgets[len(cards):]:
+            if not widget.isHidden():
+                widget.hide()
+
+    def set_label_text(self, label, text):
+        """Set a label's text if it changed"""
+        if label.text() != text:
+            label.setText(text)
+
+    def set_buttons_enabled(self, hit, stand, new_round):
+        """Enable or disable the game buttons, touching only the ones that change"""
+        for button, enabled in ((self.hit_button, hit), (self.stand_button, stand),
+                                (self.new_round_button, new_round)):
+            if button.isEnabled() != enabled:
+                button.setEnabled(enabled)
+
+    def show_status(self, message):
+        """Show a status bar message if it is not already showing"""
+        if self.status_bar.currentMessage() != message:
+            self.status_bar.showMessage(message)
 
     def hit(self):
         """Handle hit button click"""
@@ -817,24 +845,23 @@ class StatisticsDialog(QDialog):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
-        # Statistics
-        total_games = self.game.rounds_played
-        if total_games > 0:
-            win_rate = (self.game.player_wins / total_games) * 100
-            loss_rate = (self.game.dealer_wins / total_games) * 100
-            push_rate = ((total_games - self.game.player_wins - self.game.dealer_wins) / total_games) * 100
-        else:
-            win_rate = loss_rate = push_rate = 0
+        # Statistics, read from the game's streaming aggregator
+        stats = self.game.stats
+        win_low, win_high = stats.rate_interval("win")
+        return_low, return_high = stats.mean_interval()
 
         stats_text = f"""
         <div style='font-size: 14pt; line-height: 1.5;'>
-        <b>Total Rounds:</b> {total_games}<br><br>
-        <b>Player Wins:</b> {self.game.player_wins}<br>
-        <b>Dealer Wins:</b> {self.game.dealer_wins}<br>
-        <b>Ties:</b> {total_games - self.game.player_wins - self.game.dealer_wins}<br><br>
-        <b>Win Rate:</b> {win_rate:.1f}%<br>
-        <b>Loss Rate:</b> {loss_rate:.1f}%<br>
-        <b>Tie Rate:</b> {push_rate:.1f}%<br>
+        <b>Total Rounds:</b> {stats.count}<br><br>
+        <b>Player Wins:</b> {stats.wins}<br>
+        <b>Dealer Wins:</b> {stats.losses}<br>
+        <b>Ties:</b> {stats.pushes}<br><br>
+        <b>Win Rate:</b> {stats.rate("win") * 100:.1f}%
+        <small>(95% CI {win_low * 100:.1f}–{win_high * 100:.1f}%)</small><br>
+        <b>Loss Rate:</b> {stats.rate("lose") * 100:.1f}%<br>
+        <b>Tie Rate:</b> {stats.rate("push") * 100:.1f}%<br>
+        <b>Average Return:</b> {stats.mean:+.3f}
+        <small>({return_low:+.3f} to {return_high:+.3f})</small><br>
         </div>
         """
 
@@ -848,7 +875,7 @@ class StatisticsDialog(QDialog):
         layout.addWidget(close_button)
 
         self.setLayout(layout)
-        self.setFixedSize(300, 300)
+        self.setFixedSize(360, 470)
 
 
 def main():
@@ -0,0 +1,169 @@
+import threading
+from functools import lru_cache
+
+
+# This lists the dealer's possible final results, in the order the probabilities are returned
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 'bust')
+
+# This is one full deck as a composition: counts of A, 2, 3, ..., 9 and ten-valued cards
+FULL_DECK_COMPOSITION = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+# This bounds the number of memoized (dealer hand, composition) states kept between queries
+DEALER_CACHE_SIZE = 1 << 17
+
+
+class EVCancelled(Exception):
+    """Raised by hit_stand_ev() when its `cancelled` event is set during the calculation."""
+
+
+# This holds the cancel event of the hit_stand_ev() call running on each thread; it is kept out of
+# the memoized functions' arguments so it never becomes part of a cache key
+_active = threading.local()
+
+
+def _check_cancelled():
+    cancelled = getattr(_active, 'cancelled', None)
+    if cancelled is not None and cancelled.is_set():
+        raise EVCancelled()
+
+
+def composition_key(counts):
+    """Turn card counts into the canonical composition key used for memoization.
+
+    `counts` is either per-rank counts in RANKS order (13 entries, as Shoe.rank_counts gives) or an
+    existing 10-entry composition. Tens and face cards play identically, so they are merged.
+    """
+    if len(counts) == 10:
+        return tuple(counts)
+    return tuple(counts[:9]) + (sum(counts[9:]),)
+
+
+def unseen_composition(game):
+    """Composition of every card the player cannot see: the undealt shoe plus the dealer's hole card."""
+    counts = list(game.deck.rank_counts)
+    hole_card = game.dealer_hand.face_down_card
+    if hole_card:
+        counts[hole_card.id % 13] += 1
+    return composition_key(counts)
+
+
+def full_shoe_composition(num_decks=1):
+    """Composition of a freshly shuffled shoe of `num_decks` decks."""
+    return tuple(count * num_decks for count in FULL_DECK_COMPOSITION)
+
+
+@lru_cache(maxsize=DEALER_CACHE_SIZE)
+def _dealer_probabilities(hard, has_ace, composition, hits_soft_17=False, num_decks=1):
+    """Outcome probabilities for a dealer holding `hard` (Aces as 1) who draws from `composition`."""
+    total = hard + 10 if has_ace and hard <= 11 else hard
+    if total > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    # This is the play_dealer_turn() rule: stand on 17 or more, except soft 17 under H17
+    if total >= 18 or (total == 17 and not (hits_soft_17 and hard < 17)):
+        result = [0.0] * 6
+        result[total - 17] = 1.0
+        return tuple(result)
+
+    remaining = sum(composition)
+    if remaining == 0:
+        # This mirrors the shoe reshuffling all of its decks when it runs out mid-hand
+        composition = full_shoe_composition(num_decks)
+        remaining = sum(composition)
+
+    result = [0.0] * 6
+    for index, count in enumerate(composition):
+        if not count:
+            continue
+        rest = list(composition)
+        rest[index] -= 1
+        branch = _dealer_probabilities(hard + index + 1, has_ace or index == 0, tuple(rest), hits_soft_17,
+                                       num_decks)
+        weight = count / remaining
+        for outcome in range(6):
+            result[outcome] += weight * branch[outcome]
+    return tuple(result)
+
+
+def dealer_distribution(upcard, composition, hits_soft_17=False, num_decks=1):
+    """Exact probability distribution of the dealer's final result.
+
+    `upcard` is the dealer's face-up card value (2-11, Ace as 11 or 1) and `composition` the unseen
+    cards the hole card and any hits come from (see composition_key and unseen_composition). Returns
+    a dict keyed by DEALER_OUTCOMES; `hits_soft_17` selects the H17 dealer rule, and `num_decks` is
+    the shoe size the dealer draws from once the composition runs out. Results are
+    memoized on the canonical composition in a bounded LRU cache, so repeated queries for the same
+    shoe are nearly free.
+    """
+    is_ace = upcard in (1, 11)
+    probabilities = _dealer_probabilities(1 if is_ace else upcard, is_ace, composition_key(composition),
+                                          hits_soft_17, num_decks)
+    return dict(zip(DEALER_OUTCOMES, probabilities))
+
+
+def stand_ev(total, distribution):
+    """Expected value of standing on `total` against a dealer outcome distribution."""
+    ev = distribution['bust']
+    for dealer_total in (17, 18, 19, 20, 21):
+        if total > dealer_total:
+            ev += distribution[dealer_total]
+        elif total < dealer_total:
+            ev -= distribution[dealer_total]
+    return ev
+
+
+@lru_cache(maxsize=DEALER_CACHE_SIZE)
+def _best_ev(hard, has_ace, upcard, composition, hits_soft_17=False, num_decks=1):
+    """Expected value of playing a player hand on optimally (hit or stand) from `composition`."""
+    total = hard + 10 if has_ace and hard <= 11 else hard
+    return max(stand_ev(total, dealer_distribution(upcard, composition, hits_soft_17, num_decks)),
+               _hit_ev(hard, has_ace, upcard, composition, hits_soft_17, num_decks))
+
+
+def _hit_ev(hard, has_ace, upcard, composition, hits_soft_17=False, num_decks=1):
+    """Expected value of taking exactly one more card, then playing on optimally."""
+    # This stops a superseded calculation; lru_cache never stores a call that raised
+    _check_cancelled()
+    remaining = sum(composition)
+    if remaining == 0:
+        composition = full_shoe_composition(num_decks)
+        remaining = sum(composition)
+    ev = 0.0
+    for index, count in enumerate(composition):
+        if not count:
+            continue
+        next_hard = hard + index + 1
+        if next_hard > 21:
+            ev -= count / remaining
+            continue
+        rest = list(composition)
+        rest[index] -= 1
+        ev += count / remaining * _best_ev(next_hard, has_ace or index == 0, upcard, tuple(rest),
+                                           hits_soft_17, num_decks)
+    return ev
+
+
+def hit_stand_ev(hard, has_ace, upcard, composition, hits_soft_17=False, num_decks=1, cancelled=None):
+    """Exact expected values (hit, stand) for a player hand against the given unseen composition.
+
+    The hand is given as its hard total (Aces as 1) and whether it holds an Ace, e.g. from
+    Hand.hard_total and Hand.aces. Hitting assumes the player keeps playing optimally afterwards,
+    and both values account for every card removed from the shoe along the way. `hits_soft_17`
+    selects the H17 dealer rule, and `num_decks` is the size of the shoe that is reshuffled if the
+    composition runs out. If `cancelled` (a threading.Event) is set while the calculation runs, it
+    stops early and raises EVCancelled.
+    """
+    key = composition_key(composition)
+    total = hard + 10 if has_ace and hard <= 11 else hard
+    _active.cancelled = cancelled
+    try:
+        stand = stand_ev(total, dealer_distribution(upcard, key, hits_soft_17, num_decks))
+        hit = _hit_ev(hard, has_ace, upcard, key, hits_soft_17, num_decks)
+    finally:
+        _active.cancelled = None
+    return hit, stand
+
+
+def clear_cache():
+    """Drop every memoized dealer and player state."""
+    _dealer_probabilities.cache_clear()
+    _best_ev.cache_clear()
@@ -0,0 +1,203 @@
+import argparse
+
+import numpy as np
+
+from game_logic import RuleSet, mimic_dealer_policy
+from vector_sim import check_rules, play_hands, policy_table
+
+
+# This bounds how many hands are dealt per NumPy batch (paths x rounds), to keep memory flat
+HANDS_PER_BATCH = 1 << 20
+
+# This marks a path that never reached an event (ruin or doubling)
+NEVER = -1
+
+
+class BankrollResult:
+    """Outcome of a bankroll Monte Carlo run. We created this class to answer bankroll questions from one run.
+
+    Every attribute is a NumPy array with one entry per path:
+    final (bankroll after the last round), ruined, ruin_round and double_round (round number of the
+    event, NEVER if it did not happen) and max_drawdown (largest fall from a running peak, in units).
+    `trajectory` holds the bankroll every `record_every` rounds, starting with the opening bankroll
+    and always ending with the final one.
+    """
+
+    def __init__(self, bankroll, rounds, record_every, final, ruined, ruin_round, double_round, max_drawdown,
+                 trajectory):
+        self.bankroll = bankroll
+        self.rounds = rounds
+        self.record_every = record_every
+        self.final = final
+        self.ruined = ruined
+        self.ruin_round = ruin_round
+        self.double_round = double_round
+        self.max_drawdown = max_drawdown
+        self.trajectory = trajectory
+
+    @property
+    def paths(self):
+        return self.final.size
+
+    def risk_of_ruin(self):
+        """Fraction of paths that went broke within the simulated rounds."""
+        return float(np.count_nonzero(self.ruined)) / self.paths
+
+    def drawdown_percentiles(self, percentiles=(50, 90, 99)):
+        """Maximum drawdown, in bankroll units, at the given percentiles across paths."""
+        values = np.percentile(self.max_drawdown, percentiles)
+        return {p: float(value) for p, value in zip(percentiles, values)}
+
+    def double_probability(self):
+        """Fraction of paths that reached twice the starting bankroll."""
+        return float(np.count_nonzero(self.double_round != NEVER)) / self.paths
+
+    def time_to_double(self, percentiles=(50, 90)):
+        """Rounds needed to double the bankroll, at the given percentiles of the paths that doubled."""
+        doubled = self.double_round[self.double_round != NEVER]
+        if doubled.size == 0:
+            return {p: None for p in percentiles}
+        values = np.percentile(doubled, percentiles)
+        return {p: float(value) for p, value in zip(percentiles, values)}
+
+    def summary(self):
+        """Plain-dict report of the headline numbers."""
+        return {
+            'paths': self.paths,
+            'rounds': self.rounds,
+            'bankroll': self.bankroll,
+            'risk_of_ruin': self.risk_of_ruin(),
+            'mean_final': float(self.final.mean()),
+            'drawdown_percentiles': self.drawdown_percentiles(),
+            'double_probability': self.double_probability(),
+            'time_to_double': self.time_to_double(),
+        }
+
+
+def _flat_block(balance, alive, nets, bet, min_bet):
+    """Bankroll after each round of a block for a flat bet; returns (trajectory, ruin column or NEVER)."""
+    nets[~alive] = 0
+    trajectory = balance[:, None] + bet * np.cumsum(nets, axis=1)
+    # This freezes each path from the round it can no longer cover the minimum bet
+    broke = trajectory < min_bet
+    went_broke = broke.any(axis=1)
+    first = np.where(went_broke, broke.argmax(axis=1), NEVER)
+    rows = np.flatnonzero(went_broke)
+    if rows.size:
+        columns = np.arange(trajectory.shape[1])
+        frozen = trajectory[rows, first[rows]]
+        after = columns[None, :] > first[rows, None]
+        trajectory[rows] = np.where(after, frozen[:, None], trajectory[rows])
+    return trajectory, first
+
+
+def _policy_block(balance, alive, nets, bet, min_bet):
+    """Same as _flat_block for a bet policy; the bet is recomputed from the bankroll every round."""
+    trajectory = np.empty_like(nets)
+    first = np.full(balance.size, NEVER, dtype=np.int64)
+    balance = balance.copy()
+    live = alive.copy()
+    for column in range(nets.shape[1]):
+        # This never stakes more than the path still holds
+        stakes = np.minimum(np.asarray(bet(balance), dtype=np.float64), balance)
+        balance += np.where(live, stakes * nets[:, column], 0.0)
+        broke = live & (balance < min_bet)
+        first[broke] = column
+        live &= ~broke
+        trajectory[:, column] = balance
+    return trajectory, first
+
+
+def _simulate_paths(bankroll, rounds, paths, block, bet, min_bet, table, rules, rng, record_every):
+    """Play one group of paths in batches of `block` rounds; returns the per-path arrays of a BankrollResult."""
+    run_block = _policy_block if callable(bet) else _flat_block
+    balance = np.full(paths, float(bankroll))
+    alive = balance >= min_bet
+    peak = balance.copy()
+    max_drawdown = np.zeros(paths)
+    ruin_round = np.where(alive, NEVER, 0)
+    double_round = np.full(paths, NEVER, dtype=np.int64)
+    recorded = [balance.copy()]
+
+    played = 0
+    while played < rounds:
+        size = min(block, rounds - played)
+        nets = play_hands(paths * size, table, rules, rng)['net'].reshape(paths, size)
+        trajectory, first = run_block(balance, alive, nets, bet, min_bet)
+
+        # This records the first ruin and the first doubling of every path
+        newly_ruined = alive & (first != NEVER)
+        ruin_round[newly_ruined] = played + first[newly_ruined] + 1
+        doubled = trajectory >= 2 * bankroll
+        newly_doubled = (double_round == NEVER) & doubled.any(axis=1)
+        double_round[newly_doubled] = played + doubled[newly_doubled].argmax(axis=1) + 1
+
+        # This tracks the running peak and the largest fall from it
+        running_peak = np.maximum(peak[:, None], np.maximum.accumulate(trajectory, axis=1))
+        max_drawdown = np.maximum(max_drawdown, (running_peak - trajectory).max(axis=1))
+        peak = running_peak[:, -1]
+
+        # This keeps the columns that fall on a multiple of record_every rounds
+        recorded.append(trajectory[:, (-played - 1) % record_every::record_every])
+        balance = trajectory[:, -1].copy()
+        alive &= first == NEVER
+        played += size
+
+    # This adds the final bankroll when the last round is not on the recording grid
+    if rounds % record_every:
+        recorded.append(balance[:, None])
+    return balance, ruin_round, double_round, max_drawdown, np.column_stack(recorded)
+
+
+def simulate_bankroll(bankroll, rounds, paths=10000, bet=1.0, min_bet=None, policy=mimic_dealer_policy,
+                      rules=None, rng=None, record_every=100):
+    """Play `paths` independent bankroll paths of `rounds` rounds each and return a BankrollResult.
+
+    `bet` is either a flat bet in units or a callable mapping an array of current bankrolls to an
+    array of bets (for example proportional betting). A path is ruined once it can no longer cover
+    `min_bet` (the flat bet by default, else 1 unit) and stays frozen from then on. Rounds are dealt
+    in batches by vector_sim.play_hands() under `rules`, so each round pays the rule set's blackjack
+    payout; that backend has no doubling or surrender, so rules allowing them raise ValueError.
+    """
+    rules = RuleSet() if rules is None else rules
+    check_rules(rules)
+    rng = np.random.default_rng() if rng is None else rng
+    table = policy if isinstance(policy, np.ndarray) else policy_table(policy)
+    if min_bet is None:
+        min_bet = 1.0 if callable(bet) else float(bet)
+
+    # This splits the paths into groups and each group's rounds into batches, so no batch deals
+    # more than HANDS_PER_BATCH hands however many paths are asked for
+    group = min(paths, HANDS_PER_BATCH)
+    block = max(1, HANDS_PER_BATCH // group)
+    parts = [_simulate_paths(bankroll, rounds, min(group, paths - start), block, bet, min_bet, table, rules, rng,
+                             record_every)
+             for start in range(0, paths, group)]
+    final, ruin_round, double_round, max_drawdown, trajectory = (np.concatenate(arrays) for arrays in zip(*parts))
+
+    return BankrollResult(bankroll, rounds, record_every, final, ruin_round != NEVER, ruin_round, double_round,
+                          max_drawdown, trajectory)
+
+
+def main():
+    """Command-line entry point for quick bankroll questions."""
+    parser = argparse.ArgumentParser(description="Simulate 21 bankroll paths and report risk of ruin")
+    parser.add_argument("bankroll", type=float, help="starting bankroll in betting units")
+    parser.add_argument("rounds", type=int)
+    parser.add_argument("--paths", type=int, default=10000)
+    parser.add_argument("--bet", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--decks", type=int, default=1)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--payout", type=float, default=1.5, help="blackjack payout, e.g. 1.2 for 6:5")
+    args = parser.parse_args()
+
+    rules = RuleSet(args.h17, args.decks, args.payout)
+    result = simulate_bankroll(args.bankroll, args.rounds, args.paths, args.bet, rules=rules,
+                               rng=np.random.default_rng(args.seed))
+    for key, value in result.summary().items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from game_logic import CARDS, Deck, Game21, Hand
+
+
+# This is how long one timed run should take; the loop count is doubled until it does
+TARGET_SECONDS = 0.1
+REPEATS = 5
+DEFAULT_TOLERANCE = 0.10
+
+# This lists the benchmarks in run order: name -> function(loops) returning elapsed nanoseconds
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark. The function runs `loops` operations and returns the nanoseconds they took."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+# The blocks of code below benchmark the game engine.
+
+@benchmark("deck.reset")
+def bench_deck_reset(loops):
+    deck = Deck(rng=random.Random(1))
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        deck.reset()
+    return time.perf_counter_ns() - start
+
+
+@benchmark("deck.shuffle")
+def bench_deck_shuffle(loops):
+    deck = Deck(rng=random.Random(1))
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        deck.shuffle()
+    return time.perf_counter_ns() - start
+
+
+@benchmark("deck.draw")
+def bench_deck_draw(loops):
+    deck = Deck(rng=random.Random(1))
+    elapsed = 0
+    # This draws in passes of one deck and rewinds between passes, outside the timing
+    for done in range(0, loops, 52):
+        passes = min(52, loops - done)
+        start = time.perf_counter_ns()
+        for _ in range(passes):
+            deck.draw()
+        elapsed += time.perf_counter_ns() - start
+        deck.seek(0)
+    return elapsed
+
+
+@benchmark("hand.calculate_value")
+def bench_hand_calculate_value(loops):
+    hand = Hand()
+    for card in (CARDS[0], CARDS[17], CARDS[30]):
+        hand.add_card(card)
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        hand.calculate_value()
+    return time.perf_counter_ns() - start
+
+
+@benchmark("game.deal_initial_cards")
+def bench_deal_initial_cards(loops):
+    game = Game21(rng=random.Random(1))
+    elapsed = 0
+    for _ in range(loops):
+        game.new_round()
+        start = time.perf_counter_ns()
+        game.deal_initial_cards()
+        elapsed += time.perf_counter_ns() - start
+    return elapsed
+
+
+@benchmark("game.play_dealer_turn")
+def bench_play_dealer_turn(loops):
+    game = Game21(rng=random.Random(1))
+    elapsed = 0
+    for _ in range(loops):
+        # This deals until the player can stand, outside the timing
+        game.new_round()
+        game.deal_initial_cards()
+        while game.game_state != "player_turn":
+            game.new_round()
+            game.deal_initial_cards()
+        game.player_stand()
+        start = time.perf_counter_ns()
+        game.play_dealer_turn()
+        elapsed += time.perf_counter_ns() - start
+    return elapsed
+
+
+# The blocks of code below benchmark the Qt hot paths, rendered offscreen.
+
+_qt = {}
+
+
+def qt_window():
+    """Create the offscreen QApplication and MainWindow once, shared by the Qt benchmarks."""
+    if not _qt:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        import main
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        app.setStyleSheet(main.load_stylesheet(os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.qss")))
+        # This keeps benchmark rounds out of the statistics database, which is never opened
+        window = main.MainWindow(stats_path=None)
+        window.show()
+        app.processEvents()
+        _qt['app'] = app
+        _qt['window'] = window
+    return _qt['app'], _qt['window']
+
+
+def _bench_card_paint(loops, hidden):
+    from PyQt6.QtGui import QPixmap
+    from game_page import CardWidget
+
+    qt_window()
+    widget = CardWidget(None if hidden else CARDS[12], is_hidden=hidden)
+    pixmap = QPixmap(widget.size())
+    start = time.perf_counter_ns()
+    for _ in range(loops):
+        widget.render(pixmap)
+    return time.perf_counter_ns() - start
+
+
+@benchmark("qt.card_paint")
+def bench_card_paint(loops):
+    return _bench_card_paint(loops, hidden=False)
+
+
+@benchmark("qt.card_paint_hidden")
+def bench_card_paint_hidden(loops):
+    return _bench_card_paint(loops, hidden=True)
+
+
+@benchmark("qt.new_round_setup")
+def bench_new_round_setup(loops):
+    from PyQt6.QtCore import QCoreApplication, QEvent
+
+    app, window = qt_window()
+    game_page = window.game_page
+    window.stacked_widget.setCurrentWidget(game_page)
+    elapsed = 0
+    for _ in range(loops):
+        game_page.cancel_ev_calculation()
+        game_page.game.new_round()
+        start = time.perf_counter_ns()
+        game_page.new_round_setup()
+        # This includes any deferred widget deletion the round caused, which the event loop would do
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        elapsed += time.perf_counter_ns() - start
+    game_page.cancel_ev_calculation()
+    game_page.ev_pool.waitForDone()
+    return elapsed
+
+
+@benchmark("qt.apply_theme_to_all")
+def bench_apply_theme_to_all(loops):
+    app, window = qt_window()
+    themes = ("dark", "light")
+    start = time.perf_counter_ns()
+    for i in range(loops):
+        window.apply_theme_to_all(themes[i % 2])
+    return time.perf_counter_ns() - start
+
+
+def measure(function):
+    """Calibrate the loop count, then return (best, median) nanoseconds per operation over REPEATS runs."""
+    loops = 1
+    while function(loops) < TARGET_SECONDS * 1e9:
+        loops *= 2
+    per_op = [function(loops) / loops for _ in range(REPEATS)]
+    return min(per_op), statistics.median(per_op)
+
+
+def run_benchmarks(pattern=None):
+    """Run every benchmark whose name contains `pattern`; returns {name: result dict}.
+
+    The Qt benchmarks are reported as skipped if PyQt6 cannot be imported.
+    """
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        try:
+            best, median = measure(function)
+        except ImportError as e:
+            results[name] = {'skipped': str(e)}
+            continue
+        results[name] = {'ns': best, 'median_ns': median}
+    return results
+
+
+def save_baseline(path, results):
+    """Write results to a JSON baseline file with the environment they were measured in."""
+    data = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'results': results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def compare(baseline, results, tolerance=DEFAULT_TOLERANCE):
+    """Compare results to a baseline; returns rows of (name, baseline ns, current ns, ratio, status).
+
+    A benchmark more than `tolerance` slower than its baseline is a "REGRESSION", more than
+    `tolerance` faster is "faster", anything else "ok".
+    """
+    rows = []
+    for name, result in results.items():
+        before = baseline['results'].get(name, {}).get('ns')
+        now = result.get('ns')
+        if before is None or now is None:
+            rows.append((name, before, now, None, "skipped" if now is None else "new"))
+            continue
+        ratio = now / before
+        if ratio > 1 + tolerance:
+            status = "REGRESSION"
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, before, now, ratio, status))
+    return rows
+
+
+def main():
+    """Command-line entry point: run, save a baseline, or compare against one."""
+    parser = argparse.ArgumentParser(description="Benchmark the engine and the Qt hot paths")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before a regression is flagged (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.filter)
+    if args.save:
+        save_baseline(args.save, results)
+
+    if not args.compare:
+        for name, result in results.items():
+            if 'skipped' in result:
+                print(f"{name:28} skipped ({result['skipped']})")
+            else:
+                print(f"{name:28} {result['ns']:12.0f} ns  (median {result['median_ns']:.0f} ns)")
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = 0
+    for name, before, now, ratio, status in compare(baseline, results, args.tolerance):
+        if ratio is None:
+            print(f"{name:28} {status}")
+            continue
+        regressions += status == "REGRESSION"
+        print(f"{name:28} {before:12.0f} -> {now:12.0f} ns  x{ratio:5.2f}  {status}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,89 +1,263 @@
 import random
+from array import array
+from itertools import accumulate
+
+import strategy
+# This defines the four suits and thirteen ranks in canonical card-id order
+SUITS = ('H', 'D', 'C', 'S')
+RANKS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+
+# This defines suit symbols using Unicode characters
+# We used Unicode because it provides proper suit symbols that work across all platforms
+SUIT_SYMBOLS = {
+    'H': '♥',  # Hearts (red)
+    'D': '♦',  # Diamonds (red)
+    'C': '♣',  # Clubs (black)
+    'S': '♠'  # Spades (black)
+}
+
+
 class Card:
-    """Represents a playing card with suit and rank"""
-
-    def __init__(self, suit, rank):
-        self.suit = suit  # 'H', 'D', 'C', 'S'
-        self.rank = rank  # 'A', '2', '3', ..., '10', 'J', 'Q', 'K'
-
-        # This defines suit symbols using Unicode characters
-        # We used Unicode because it provides proper suit symbols that work across all platforms
-        self.suit_symbols = {
-            'H': '♥',  # Hearts (red)
-            'D': '♦',  # Diamonds (red)
-            'C': '♣',  # Clubs (black)
-            'S': '♠'  # Spades (black)
-        }
+    """Represents a playing card with suit and rank.
+
+    There are exactly 52 Card objects, built once when this module is imported and shared by every
+    deck and hand. Calling Card(suit, rank) returns the canonical instance, so cards can be compared
+    by identity and looked up by their small integer id through CARDS[card_id].
+    """
+
+    __slots__ = ('suit', 'rank', 'id', 'value', 'is_ace', 'display_text')
+
+    def __new__(cls, suit, rank):
+        # This returns the shared instance instead of allocating a new card
+        try:
+            return _CARDS_BY_KEY[(suit, rank)]
+        except KeyError:
+            raise ValueError(f"Unknown card: suit={suit!r}, rank={rank!r}") from None
+
+    @classmethod
+    def _create(cls, card_id, suit, rank):
+        """Build one canonical card. We wrote this method so the card table is only created at import time."""
+        card = object.__new__(cls)
+        # This bypasses __setattr__ because cards are immutable once built
+        object.__setattr__(card, 'suit', suit)  # 'H', 'D', 'C', 'S'
+        object.__setattr__(card, 'rank', rank)  # 'A', '2', '3', ..., '10', 'J', 'Q', 'K'
+        object.__setattr__(card, 'id', card_id)
+        # This precomputes the value: 10 for face cards, 11 for Aces (adjusted in Hand), else the number
+        value = 10 if rank in ('J', 'Q', 'K') else 11 if rank == 'A' else int(rank)
+        object.__setattr__(card, 'value', value)
+        object.__setattr__(card, 'is_ace', rank == 'A')
+        object.__setattr__(card, 'display_text', f"{rank}{SUIT_SYMBOLS[suit]}")
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        # This keeps identity when cards are pickled, e.g. when sent to worker processes
+        return (card_from_id, (self.id,))
+
+    def __repr__(self):
+        return f"Card({self.suit!r}, {self.rank!r})"
+
+    @property
+    def suit_symbols(self):
+        """Suit symbol lookup, kept for code written against the old per-card dict."""
+        return SUIT_SYMBOLS
 
     def get_value(self):
-        """Get the numerical value of the card. We wrote this method to calculate card values for the game."""
-        # This checks if the card is a face card (Jack, Queen, King)
-        if self.rank in ['J', 'Q', 'K']:
-            # This returns 10 for face cards
-            return 10
-        # This checks if the card is an Ace
-        elif self.rank == 'A':
-            # This returns 11 for Aces by default, we adjusted this later in the code.
-            return 11
-        else:
-            # This converts number cards to integers
-            return int(self.rank)
+        """Get the numerical value of the card. Aces count 11 here, we adjust this in Hand."""
+        return self.value
 
     def get_display_text(self):
         """Get the text representation of the card. We wrote this method for displaying cards in the UI."""
-        # This returns the card rank followed by the suit symbol
-        return f"{self.rank}{self.suit_symbols[self.suit]}"
+        return self.display_text
 
 
+_CARDS_BY_KEY = {}
+# This builds the 52 canonical cards; card id = suit index * 13 + rank index
+CARDS = tuple(Card._create(s * 13 + r, suit, rank)
+              for s, suit in enumerate(SUITS) for r, rank in enumerate(RANKS))
+_CARDS_BY_KEY.update(((card.suit, card.rank), card) for card in CARDS)
 
-class Deck:
-    """Represents a standard 52-card deck. We created this class to manage the deck of cards."""
 
-    def __init__(self):
-        self.cards = []
+def card_from_id(card_id):
+    """Return the canonical card for a card id (0-51)."""
+    return CARDS[card_id]
+
+
+# This maps each card id to its hard value (Aces count 1) for the batch round engine
+HARD_VALUES = bytes(1 if card.is_ace else card.value for card in CARDS)
+
+# This maps each card id to its Hi-Lo tag: +1 for 2-6, 0 for 7-9, -1 for tens and Aces
+HI_LO_TAGS = tuple(1 if 2 <= value <= 6 else (0 if 7 <= value <= 9 else -1) for value in HARD_VALUES)
+
+
+# This is one deck of card ids in id order, the starting point of every shuffle
+_SORTED_DECK = bytes(range(len(CARDS)))
+
+
+def next_shuffle_seed(seed):
+    """Derive the seed for a reshuffle forced mid-hand from the current shuffle seed."""
+    return (seed * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+
+
+class Shoe:
+    """Represents a dealing shoe of 1 to 8 standard decks. We created this class so multi-deck games stay cheap.
+
+    The shoe stores card ids (see CARDS) in a bytearray and deals by moving a read cursor, so dealing
+    and reshuffling never create or destroy card objects. The cut card sits at `penetration` of the
+    way through the shoe; once it has been reached needs_shuffle() tells the game to reshuffle
+    between rounds.
+
+    Every full reshuffle is driven by a 64-bit seed (kept in `seed`), so the order of the shoe can
+    be rebuilt exactly from the seed alone. A reshuffle forced by running out mid-hand uses
+    next_shuffle_seed() of the previous seed, so it is reproducible too.
+
+    The Hi-Lo running count after every position is worked out once per shuffle, so running_count
+    and true_count are plain lookups at the cursor and dealing a card costs nothing extra. This also
+    keeps the count right when the batch engine moves the cursor directly.
+    """
+
+    def __init__(self, num_decks=1, penetration=0.75, rng=None):
+        # This checks the shoe size and cut card position are sensible
+        if not 1 <= num_decks <= 8:
+            raise ValueError("num_decks must be between 1 and 8")
+        if not 0 < penetration <= 1:
+            raise ValueError("penetration must be in the range (0, 1]")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        # This uses the global random module unless a dedicated generator is given
+        self.rng = rng if rng is not None else random
+        # This stores every card id once per deck
+        self._ids = bytearray(_SORTED_DECK) * num_decks
+        self.size = len(self._ids)
+        # This places the cut card; reaching it means the shoe should be reshuffled
+        self.cut_card = max(1, int(self.size * penetration))
+        self.cursor = 0
+        self.seed = None
+        self._rank_counts = [0] * len(RANKS)
+        # This holds the running count after each number of dealt cards (0 to size)
+        self._count_prefix = [0] * (self.size + 1)
         self.reset()
 
-    def reset(self):
-        """Reset and shuffle the deck. We wrote this method to recreate a full deck when needed."""
-        # This defines the four suits
-        suits = ['H', 'D', 'C', 'S']
-        # This defines all possible ranks
-        ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        # This creates all 52 cards using list comprehension
-        self.cards = [Card(suit, rank) for suit in suits for rank in ranks]
-        # This shuffles the deck
-        self.shuffle()
+    def reset(self, seed=None):
+        """Collect every card and reshuffle the whole shoe, from `seed` or a fresh seed from the rng."""
+        self.seed = self.rng.getrandbits(64) if seed is None else seed
+        self.cursor = 0
+        self._rank_counts[:] = [4 * self.num_decks] * len(RANKS)
+        # This puts the cards back in id order so the seed alone decides the shuffled order
+        self._ids[:] = _SORTED_DECK * self.num_decks
+        random.Random(self.seed).shuffle(self._ids)
+        self._count_prefix[:] = accumulate(map(HI_LO_TAGS.__getitem__, self._ids), initial=0)
 
     def shuffle(self):
-        """Shuffle the deck. We wrote this method to randomize card order."""
-        # This shuffles the cards using Python's random module
-        random.shuffle(self.cards)
+        """Reshuffle the whole shoe from a fresh seed, so the new order can still be rebuilt from `seed`."""
+        self.reset()
 
     def draw(self):
-        """Draw a card from the deck. We wrote this method to remove and return the top card."""
-        # This checks if the deck is empty
-        if len(self.cards) == 0:
-            # This resets the deck if empty
-            self.reset()
-        # This removes and returns the last card from the deck
-        return self.cards.pop()
+        """Deal the next card from the shoe."""
+        # This only happens if the cut card is ignored and the shoe runs out mid-hand
+        if self.cursor >= self.size:
+            self.reset(next_shuffle_seed(self.seed))
+        card_id = self._ids[self.cursor]
+        self.cursor += 1
+        self._rank_counts[card_id % 13] -= 1
+        return CARDS[card_id]
+
+    def seek(self, cursor):
+        """Move the read cursor to `cursor` in the current order, bringing the rank counts up to date."""
+        if not 0 <= cursor <= self.size:
+            raise ValueError(f"cursor must be between 0 and {self.size}")
+        self.cursor = cursor
+        self._recount()
+
+    def _recount(self):
+        """Rebuild the per-rank counts from the undealt cards, after the cursor was moved."""
+        counts = [0] * len(RANKS)
+        for card_id in self._ids[self.cursor:]:
+            counts[card_id % 13] += 1
+        self._rank_counts[:] = counts
+
+    def needs_shuffle(self):
+        """Check if the cut card has been reached."""
+        return self.cursor >= self.cut_card
+
+    def remaining(self):
+        """Get the number of cards left to deal."""
+        return self.size - self.cursor
+
+    def __len__(self):
+        return self.size - self.cursor
+
+    @property
+    def running_count(self):
+        """Hi-Lo running count of every card dealt since the last reshuffle."""
+        return self._count_prefix[self.cursor]
+
+    @property
+    def decks_remaining(self):
+        """Undealt cards measured in decks."""
+        return (self.size - self.cursor) / 52
+
+    @property
+    def true_count(self):
+        """Running count per remaining deck (the running count itself once the shoe is empty)."""
+        if self.cursor >= self.size:
+            return float(self._count_prefix[self.cursor])
+        return self._count_prefix[self.cursor] * 52 / (self.size - self.cursor)
+
+    @property
+    def rank_counts(self):
+        """Cards left to deal for each rank, in RANKS order."""
+        return tuple(self._rank_counts)
+
+    @property
+    def cards(self):
+        """The undealt cards, in the order they will be dealt. This builds a new list on every call."""
+        return [CARDS[card_id] for card_id in self._ids[self.cursor:]]
+
+
+class Deck(Shoe):
+    """Represents a standard 52-card deck. We kept this class as a single-deck shoe with no cut card."""
+
+    def __init__(self, rng=None):
+        super().__init__(num_decks=1, penetration=1.0, rng=rng)
+
 
 class Hand:
-    """Represents a player's hand. We created this class to manage a collection of cards."""
+    """Represents a player's hand. We created this class to manage a collection of cards.
+
+    The hand keeps a running hard total (every Ace counted as 1) and an Ace count, updated as cards
+    are added, so the total, soft, bust and blackjack queries never have to loop over the cards.
+    """
     def __init__(self):
         self.cards = []
         self.is_dealer = False
         self.face_down_card = None  # For dealer's hidden card
+        self.hard_total = 0  # Sum of the visible cards with every Ace counted as 1
+        self.aces = 0  # Number of visible Aces
+
+    def _count_card(self, card):
+        """Fold one visible card into the running totals."""
+        if card.is_ace:
+            self.hard_total += 1
+            self.aces += 1
+        else:
+            self.hard_total += card.value
 
     def add_card(self, card, face_up=True):
         """Add a card to the hand. We wrote this method to handle both face-up and face-down cards."""
         # This checks if the card should be hidden and if this is the dealer's hand
         if not face_up and self.is_dealer:
-            # This stores the card as hidden for dealer
+            # This stores the card as hidden for dealer; it is not counted until revealed
             self.face_down_card = card
         else:
             # This adds the card normally to the hand
             self.cards.append(card)
+            self._count_card(card)
 
     def reveal_hidden_card(self):
         """Reveal the hidden card. We wrote this method for the dealer to show their hidden card."""
@@ -91,50 +265,30 @@ class Hand:
         if self.face_down_card:
             # This adds the hidden card to the visible cards
             self.cards.append(self.face_down_card)
+            self._count_card(self.face_down_card)
             # This clears the hidden card reference
             self.face_down_card = None
 
     def calculate_value(self):
-        """Calculate the hand value. We wrote this method to handle Ace values intelligently."""
-        # This initializes the total value
-        total = 0
-        # This counts the number of Aces
-        aces = 0
-
-        # This loops through all visible cards
-        for card in self.cards:
-            # This gets the card's value
-            value = card.get_value()
-            # This checks if the card is an Ace
-            if card.rank == 'A':
-                # This increments the Ace count
-                aces += 1
-            # This adds the card value to the total
-            total += value
-
-        # This adjusts Aces from 11 to 1 if the total is over 21
-        while total > 21 and aces > 0:
-            # This subtracts 10 (changes Ace from 11 to 1)
-            total -= 10
-            # This decreases the Ace count
-            aces -= 1
-
-        # This returns the final total
-        return total
+        """Calculate the hand value. One Ace counts as 11 whenever that does not bust the hand."""
+        # At most one Ace can ever count as 11, so this is the only adjustment needed
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+
+    def is_soft(self):
+        """Check if the hand is soft, meaning an Ace is currently counted as 11."""
+        return self.aces > 0 and self.hard_total <= 11
 
     def is_bust(self):
         """Check if hand is bust. We wrote this method to determine if a hand exceeds 21."""
-        # This checks if the hand value is greater than 21
-        return self.calculate_value() > 21
-
+        # Aces already count as 1 in the hard total, so this is the lowest possible value
+        return self.hard_total > 21
 
     def has_blackjack(self):
         """Check if hand is a natural blackjack. We wrote this method to detect instant wins."""
-        # This checks if there are exactly 2 cards with total value 21 and one is an Ace
-        return (len(self.cards) == 2 and
-                self.calculate_value() == 21 and
-                ('A' in [card.rank for card in self.cards]))
-
+        # This checks for exactly 2 cards: an Ace and a ten-valued card (hard total 11)
+        return len(self.cards) == 2 and self.aces > 0 and self.hard_total == 11
 
     def clear(self):
         """Clear the hand. We wrote this method to reset the hand for a new round."""
@@ -142,7 +296,9 @@ class Hand:
         self.cards = []
         # This clears any hidden card
         self.face_down_card = None
-
+        # This resets the running totals
+        self.hard_total = 0
+        self.aces = 0
 
     def get_card_count(self):
         """Get total number of cards. We wrote this method to count all cards including hidden ones."""
@@ -150,29 +306,393 @@ class Hand:
         return len(self.cards) + (1 if self.face_down_card else 0)
 
 
+def new_round_stats():
+    """Create an empty set of batch round counters, as returned by Game21.play_rounds()."""
+    return {
+        'rounds': 0,
+        'wins': 0,
+        'losses': 0,
+        'pushes': 0,
+        'blackjacks': 0,  # Player naturals
+        'player_busts': 0,
+        'dealer_busts': 0,
+        'doubles': 0,
+        'surrenders': 0,
+        'net': 0.0,  # Total return in bet units, including blackjack payouts and doubled bets
+        'wagered': 0.0,  # Total units bet, including doubles
+        # Dealer's final total when the dealer played out the hand and stood
+        'dealer_totals': {17: 0, 18: 0, 19: 0, 20: 0, 21: 0},
+    }
+
+
+def new_table_stats(seats):
+    """Empty counters for a multi-seat table: one array entry per seat, seat 0 acting first.
+
+    The dealer's final totals are counted once per round in which the dealer played.
+    """
+    stats = {'rounds': 0, 'seats': seats}
+    for key in ('wins', 'losses', 'pushes', 'blackjacks', 'player_busts', 'dealer_busts', 'doubles',
+                'surrenders'):
+        stats[key] = array('q', bytes(8 * seats))
+    stats['net'] = array('d', bytes(8 * seats))
+    stats['wagered'] = array('d', bytes(8 * seats))
+    stats['dealer_totals'] = {17: 0, 18: 0, 19: 0, 20: 0, 21: 0}
+    return stats
+
+
+def merge_round_stats(into, other):
+    """Add the counters in `other` to `into` (both from new_round_stats()) and return `into`."""
+    for key, value in other.items():
+        if key == 'dealer_totals':
+            for total, count in value.items():
+                into['dealer_totals'][total] += count
+        else:
+            into[key] += value
+    return into
+
+
+# This lists the actions a policy can return; True and False work as HIT and STAND
+STAND = 0
+HIT = 1
+DOUBLE = 2
+SURRENDER = 3
+
+
+def mimic_dealer_policy(total, soft, upcard):
+    """Player policy that copies the dealer: hit below 17, stand on 17 or more.
+
+    A policy is any callable taking (player total, soft flag, dealer upcard value with Ace = 11)
+    and returning an action: STAND, HIT, DOUBLE or SURRENDER (True/False mean hit/stand). DOUBLE and
+    SURRENDER only count on the first decision of a hand and where the rules allow them; otherwise
+    they are played as HIT.
+    """
+    return total < 17
+
+
+class RuleSet:
+    """House rules for a table or a simulation. We created this class so rule variants can be compared.
+
+    A rule set is chosen once; compile_round_engine() turns it into a round function with the rules
+    built in, so the batch loop never checks rule flags per hand.
+    """
+
+    # This lists the allowed double-down rules: never, on any first two cards, or on hard 9-11 / 10-11
+    DOUBLE_RULES = ('none', 'any', '9-11', '10-11')
+
+    def __init__(self, dealer_hits_soft_17=False, num_decks=1, blackjack_payout=1.5, double_on='none',
+                 surrender=False):
+        if not 1 <= num_decks <= 8:
+            raise ValueError("num_decks must be between 1 and 8")
+        if blackjack_payout <= 0:
+            raise ValueError("blackjack_payout must be positive")
+        if double_on not in self.DOUBLE_RULES:
+            raise ValueError(f"double_on must be one of {self.DOUBLE_RULES}")
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.num_decks = num_decks
+        self.blackjack_payout = blackjack_payout  # 1.5 for 3:2, 1.2 for 6:5
+        self.double_on = double_on
+        self.surrender = surrender  # Late surrender of the first two cards for half the bet
+
+    def _key(self):
+        return (self.dealer_hits_soft_17, self.num_decks, self.blackjack_payout, self.double_on, self.surrender)
+
+    def __eq__(self, other):
+        return isinstance(other, RuleSet) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return (f"RuleSet(dealer_hits_soft_17={self.dealer_hits_soft_17}, num_decks={self.num_decks}, "
+                f"blackjack_payout={self.blackjack_payout}, double_on={self.double_on!r}, "
+                f"surrender={self.surrender})")
+
+
+def dealer_hits_stand_17(hand):
+    """Dealer rule S17: hit below 17, stand on every 17."""
+    return hand.calculate_value() < 17
+
+
+def dealer_hits_soft_17(hand):
+    """Dealer rule H17: hit below 17 and on soft 17."""
+    total = hand.calculate_value()
+    return total < 17 or (total == 17 and hand.is_soft())
+
+
+# This is the batch round loop, for a table of `seats` seats sharing one shoe. Cards come out in
+# real dealing order: one card to each seat, the dealer's upcard, a second card to each seat, then
+# the hole card. Seats then act in turn and the dealer plays once for every seat still in the round.
+# compile_round_engine() fills in the rule-dependent pieces and compiles one copy per rule set, so
+# rule choices cost nothing inside the loop. Counters are written `wins{s}`: {s} is "[seat]" in the
+# multi-seat engine and empty in the single-seat one, which keeps plain local counters.
+_ROUND_ENGINE_TEMPLATE = """
+def play_rounds(game, n, policy, bet_policy, seats=1):
+    stats = new_stats(seats)
+    wins = {int_counter}
+    losses = {int_counter}
+    pushes = {int_counter}
+    blackjacks = {int_counter}
+    player_busts = {int_counter}
+    dealer_busts = {int_counter}
+    doubles = {int_counter}
+    surrenders = {int_counter}
+    net = {float_counter}
+    wagered = {float_counter}
+    dealer_totals = stats['dealer_totals']
+
+    shoe = game.deck
+    # The shoe reshuffles in place, so these references stay valid across reshuffles
+    ids = shoe._ids
+    size = shoe.size
+    cut_card = shoe.cut_card
+    counts = shoe._count_prefix
+    values = HARD_VALUES
+    pos = shoe.cursor
+
+    # This holds each seat's final total and bet for the dealer comparison; 0 means already settled
+    seat_totals = {int_counter}
+    seat_bets = {int_counter}
+    seat_range = range(seats)
+    initial_cards = 2 * seats + 2
+
+    for _ in range(n):
+        # This reshuffles between rounds at the cut card, or if the initial deal would not fit
+        if pos >= cut_card or pos > size - initial_cards:
+            shoe.reset()
+            pos = 0
+{opening_bet}
+
+        start = pos
+        pos += initial_cards
+        up = values[ids[start + seats]]
+        hole = values[ids[start + initial_cards - 1]]
+        dealer_hard = up + hole
+        dealer_soft = up == 1 or hole == 1
+        upcard = 11 if up == 1 else up
+        live_seats = 0
+
+        for seat in seat_range:
+            wagered{s} += bet
+            seat_totals{s} = 0
+            p1 = values[ids[start + seat]]
+            p2 = values[ids[start + seats + 1 + seat]]
+            player_hard = p1 + p2
+            player_soft = p1 == 1 or p2 == 1
+
+            # This settles a natural straight away, like deal_initial_cards()
+            if player_soft and player_hard == 11:
+                blackjacks{s} += 1
+                if dealer_soft and dealer_hard == 11:
+                    pushes{s} += 1
+                else:
+                    wins{s} += 1
+                    net{s} += {blackjack_payout!r} * bet
+                continue
+
+            seat_bet = bet
+            soft = player_soft and player_hard <= 11
+            action = policy(player_hard + 10 if soft else player_hard, soft, upcard)
+{first_decision}
+            # This lets the policy hit until it stands or the hand busts
+            while action:
+                if pos >= size:
+                    shoe.reset(next_shuffle_seed(shoe.seed))
+                    pos = 0
+                value = values[ids[pos]]
+                pos += 1
+                player_hard += value
+                if value == 1:
+                    player_soft = True
+                if player_hard > 21:
+                    break
+                soft = player_soft and player_hard <= 11
+                action = policy(player_hard + 10 if soft else player_hard, soft, upcard)
+
+            if player_hard > 21:
+                player_busts{s} += 1
+                losses{s} += 1
+                net{s} -= seat_bet
+                continue
+            seat_totals{s} = player_hard + 10 if player_soft and player_hard <= 11 else player_hard
+            seat_bets{s} = seat_bet
+            live_seats += 1
+
+        # This skips the dealer's turn when every seat is already settled
+        if not live_seats:
+            continue
+
+        # This plays the dealer to the table's rule
+        while True:
+            dealer_total = dealer_hard + 10 if dealer_soft and dealer_hard <= 11 else dealer_hard
+            if {dealer_stands}:
+                break
+            if pos >= size:
+                shoe.reset(next_shuffle_seed(shoe.seed))
+                pos = 0
+            value = values[ids[pos]]
+            pos += 1
+            dealer_hard += value
+            if value == 1:
+                dealer_soft = True
+
+        if dealer_total > 21:
+            for seat in seat_range:
+                if seat_totals{s}:
+                    dealer_busts{s} += 1
+                    wins{s} += 1
+                    net{s} += seat_bets{s}
+            continue
+        dealer_totals[dealer_total] += 1
+        for seat in seat_range:
+            player_total = seat_totals{s}
+            if not player_total:
+                continue
+            if player_total > dealer_total:
+                wins{s} += 1
+                net{s} += seat_bets{s}
+            elif dealer_total > player_total:
+                losses{s} += 1
+                net{s} -= seat_bets{s}
+            else:
+                pushes{s} += 1
+
+    # This hands the cursor back to the shoe and brings its rank counts up to date
+    shoe.seek(pos)
+
+    stats['rounds'] = n
+    stats['wins'] = ints(wins)
+    stats['losses'] = ints(losses)
+    stats['pushes'] = ints(pushes)
+    stats['blackjacks'] = ints(blackjacks)
+    stats['player_busts'] = ints(player_busts)
+    stats['dealer_busts'] = ints(dealer_busts)
+    stats['doubles'] = ints(doubles)
+    stats['surrenders'] = ints(surrenders)
+    stats['net'] = floats(net)
+    stats['wagered'] = floats(wagered)
+    return stats
+"""
+
+# This is the opening bet of a round: one unit, or the bet policy's bet for the true count
+_FLAT_BET = """
+        bet = 1"""
+
+_COUNT_BET = """
+        bet = bet_policy(counts[pos] * 52 / (size - pos))"""
+
+
+_SURRENDER_BLOCK = """
+            if action == 3:
+                surrenders{s} += 1
+                losses{s} += 1
+                net{s} -= 0.5 * seat_bet
+                continue
+"""
+
+_DOUBLE_BLOCK = """
+            if action == 2 and {condition}:
+                # This doubles the bet, deals exactly one card and stands
+                doubles{s} += 1
+                wagered{s} += seat_bet
+                seat_bet += seat_bet
+                if pos >= size:
+                    shoe.reset(next_shuffle_seed(shoe.seed))
+                    pos = 0
+                value = values[ids[pos]]
+                pos += 1
+                player_hard += value
+                if value == 1:
+                    player_soft = True
+                action = 0
+"""
+
+# This is when a hand may be doubled, by RuleSet.double_on
+_DOUBLE_CONDITIONS = {
+    'any': "True",
+    '9-11': "9 <= player_hard <= 11 and not soft",
+    '10-11': "10 <= player_hard <= 11 and not soft",
+}
+
+# This is what changes between the single-seat and the multi-seat engine: how a counter is indexed,
+# its starting value, and how counters become the returned stats
+_SINGLE_SEAT = {'s': "", 'int_counter': "0", 'float_counter': "0.0"}
+_MULTI_SEAT = {'s': "[seat]", 'int_counter': "[0] * seats", 'float_counter': "[0.0] * seats"}
+
+_compiled_engines = {}
+
+
+def compile_round_engine(rules, count_bets=False, table=False):
+    """Build the batch round function for a rule set, or reuse the one already built.
+
+    The returned function has the signature play_rounds(game, n, policy, bet_policy) and returns the
+    counters of new_round_stats(). With `count_bets` each round's bet is bet_policy(true count);
+    otherwise bet_policy is ignored and every round bets one unit. With `table` it is the multi-seat
+    engine instead: play_rounds(game, n, policy, bet_policy, seats), returning new_table_stats(). Both
+    are built from the same template, so a rule is only ever written once.
+    """
+    engine = _compiled_engines.get((rules, count_bets, table))
+    if engine is not None:
+        return engine
+
+    seating = _MULTI_SEAT if table else _SINGLE_SEAT
+    first_decision = ""
+    if rules.surrender:
+        first_decision += _SURRENDER_BLOCK.format(**seating)
+    if rules.double_on != 'none':
+        first_decision += _DOUBLE_BLOCK.format(condition=_DOUBLE_CONDITIONS[rules.double_on], **seating)
+    # H17 stands on hard 17 (dealer_hard == 17) or on 18 and above
+    dealer_stands = "dealer_hard >= 17 or dealer_total >= 18" if rules.dealer_hits_soft_17 else "dealer_total >= 17"
+    source = _ROUND_ENGINE_TEMPLATE.format(blackjack_payout=float(rules.blackjack_payout),
+                                           opening_bet=_COUNT_BET if count_bets else _FLAT_BET,
+                                           first_decision=first_decision, dealer_stands=dealer_stands, **seating)
+
+    namespace = {'HARD_VALUES': HARD_VALUES, 'next_shuffle_seed': next_shuffle_seed}
+    if table:
+        namespace.update(new_stats=new_table_stats, ints=lambda values: array('q', values),
+                         floats=lambda values: array('d', values))
+    else:
+        namespace.update(new_stats=lambda seats: new_round_stats(), ints=int, floats=float)
+    exec(compile(source, f"<round engine {rules!r}>", "exec"), namespace)
+    engine = namespace['play_rounds']
+    _compiled_engines[(rules, count_bets, table)] = engine
+    return engine
+
+
+# This is the largest table the multi-seat engine deals to
+MAX_SEATS = 7
+
+
 class Game21:
     """Main game class implementing the 21 Card Game"""
 
-    def __init__(self):
+    def __init__(self, num_decks=1, penetration=0.75, rng=None, rules=None):
+        # This picks the house rules; a RuleSet overrides num_decks
+        self.rules = rules if rules is not None else RuleSet(num_decks=num_decks)
+        # This chooses the dealer's hitting rule and the batch round engine once for the table
+        self.dealer_hits = dealer_hits_soft_17 if self.rules.dealer_hits_soft_17 else dealer_hits_stand_17
+        self._round_engine = compile_round_engine(self.rules)
+        # This creates the shoe once; deal_initial_cards reshuffles it once the cut card comes out
+        # A dedicated random.Random can be passed in for independent, reproducible games
+        self.deck = Shoe(self.rules.num_decks, penetration, rng)
+        # This creates the player and dealer hands, which are cleared and reused every round
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        # This marks the dealer hand as dealer
+        self.dealer_hand.is_dealer = True
+        # This holds opt-in callables that are called with the game whenever a round finishes
+        self.round_listeners = []
+        # This tracks the session statistics, updated once per finished round
+        self.player_wins = 0
+        self.dealer_wins = 0
+        self.rounds_played = 0
         # Start immediately with a fresh round
         self.new_round()
 
-        # Our initialcode had a statistics section but after Vitor pointed out the assignment is just a single round assignment.
-        # We commented it for future purposes.
-        # self.player_wins = 0
-        # self.dealer_wins = 0
-        # self.rounds_played = 0
-
     def new_round(self):
         """ Prepares for a new round. We wrote this method to reset everything for a fresh game."""
-        # This creates a new deck
-        self.deck = Deck()
-        # This creates a player hand
-        self.player_hand = Hand()
-        # This creates a dealer hand
-        self.dealer_hand = Hand()
-        # This marks the dealer hand as dealer
-        self.dealer_hand.is_dealer = True
+        # This empties both hands; the deck carries over between rounds
+        self.player_hand.clear()
+        self.dealer_hand.clear()
 
         # This sets the initial game state
         self.game_state = "idle"
@@ -180,21 +700,31 @@ class Game21:
         self.result = None
         # This tracks if dealer's hidden card is revealed
         self.dealer_hidden_revealed = False
+        # This records where the round starts in the shoe and what the player did, for replays
+        self.round_seed = None
+        self.round_cursor = 0
+        self.player_hits = 0
+        self.player_stood = False
 
     def reset_game(self):
         """ Reset the entire game. We wrote this method to completely restart the game."""
-        # For future use if statistics tracking is implemented
-        # self.player_wins = 0
-        # self.dealer_wins = 0
-        # self.rounds_played = 0
+        # This resets the session statistics
+        self.player_wins = 0
+        self.dealer_wins = 0
+        self.rounds_played = 0
+        # This collects and reshuffles the whole shoe
+        self.deck.reset()
         # This calls new_round to reset everything
         self.new_round()
 
     def deal_initial_cards(self):
         """ Deal initial cards. We wrote this method to start a round with 2 cards each. """
-        # This resets the deck if it's running low
-        if len(self.deck.cards) < 20:
+        # This reshuffles the shoe between rounds once the cut card has been reached
+        if self.deck.needs_shuffle():
             self.deck.reset()
+        # This remembers the shuffle seed and shoe position the round is dealt from
+        self.round_seed = self.deck.seed
+        self.round_cursor = self.deck.cursor
 
         # This deals the first card to player
         self.player_hand.add_card(self.deck.draw())
@@ -218,14 +748,21 @@ class Game21:
             else:
                 # This sets result to win for player
                 self.result = "win"
-                # Commented out for future purposes.
-                # self.player_wins += 1
-            # Commented out for future purposes.
-            # self.rounds_played += 1
+            self._finish_round()
         else:
             self.game_state = "player_turn"
             self.result = None
 
+    def _finish_round(self):
+        """Count the finished round and notify the round listeners."""
+        self.rounds_played += 1
+        if self.result == "win":
+            self.player_wins += 1
+        elif self.result == "lose":
+            self.dealer_wins += 1
+        for listener in self.round_listeners:
+            listener(self)
+
     def draw_card(self):
         """Return the next card in the shuffled deck"""
         return self.deck.draw()
@@ -256,14 +793,13 @@ class Game21:
 
         card = self.draw_card()
         self.player_hand.add_card(card)
+        self.player_hits += 1
 
         if self.player_hand.is_bust():
             self.game_state = "finished"
             self.result = "lose"
-            # Commented out for future purposes.
-            # self.dealer_wins += 1
-            # self.rounds_played += 1
             self.dealer_hand.reveal_hidden_card()
+            self._finish_round()
 
         return card
 
@@ -273,6 +809,38 @@ class Game21:
         """
         return self.player_hand.calculate_value()
 
+    @property
+    def round_id(self):
+        """Number of the current round, counting from 1; a finished round keeps its number until the next deal."""
+        return self.rounds_played if self.game_state == "finished" else self.rounds_played + 1
+
+    def visible_count(self):
+        """Hi-Lo (running count, true count) of the cards the player has seen.
+
+        This is the shoe's count without the dealer's hole card while it is still face down.
+        """
+        shoe = self.deck
+        running = shoe.running_count
+        hole_card = self.dealer_hand.face_down_card
+        if hole_card:
+            running -= HI_LO_TAGS[hole_card.id]
+        if shoe.remaining() == 0:
+            return running, float(running)
+        return running, running / shoe.decks_remaining
+
+    def recommended_action(self):
+        """
+        Return the basic-strategy move for the player's current hand, "hit" or "stand".
+        The answer is a single lookup in the precomputed table for this shoe size and dealer rule.
+        Returns None when it is not the player's turn.
+        """
+        if self.game_state != "player_turn" or not self.dealer_hand.cards:
+            return None
+        table = strategy.load_table(self.rules.num_decks, self.rules.dealer_hits_soft_17)
+        upcard = self.dealer_hand.cards[0]
+        return strategy.lookup(table, self.player_hand.calculate_value(), self.player_hand.is_soft(),
+                               11 if upcard.is_ace else upcard.value)
+
     # THe block of code below handles the dealers actions.
     def reveal_dealer_card(self):
         """
@@ -290,21 +858,21 @@ class Game21:
 
     def play_dealer_turn(self):
         """
-        Dealer must hit until their total is 17 or more, then stand.
+        Dealer must hit until their total is 17 or more, then stand
+        (and also hits soft 17 when the rules say so).
         Returns list of cards drawn during dealer's turn.
         """
         self.game_state = "dealer_turn"
         drawn_cards = []
 
-        while self.dealer_hand.calculate_value() < 17:
+        while self.dealer_hits(self.dealer_hand):
             card = self.draw_card()
             self.dealer_hand.add_card(card)
             drawn_cards.append(card)
 
         self.game_state = "finished"
         self.determine_winner()
-        # Commented out for future purposes.
-        # self.rounds_played += 1
+        self._finish_round()
 
         return drawn_cards
 
@@ -315,12 +883,8 @@ class Game21:
         self.determine_winner()
 
         if self.result == "win":
-            # Commented out for future purposes.
-            # self.player_wins += 1
             return "Player wins!"
         elif self.result == "lose":
-            # Commented out for future purposes.
-            # self.dealer_wins += 1
             return "Dealer wins!"
         elif self.result == "push":
             return "Push (tie)."
@@ -337,20 +901,12 @@ class Game21:
 
         if self.player_hand.is_bust():
             self.result = "lose"
-            # Commented out for future purposes.
-            # self.dealer_wins += 1
         elif self.dealer_hand.is_bust():
             self.result = "win"
-            # Commented out for future purposes.
-            # self.player_wins += 1
         elif player_value > dealer_value:
             self.result = "win"
-            # Commented out for future purposes.
-            # self.player_wins += 1
         elif dealer_value > player_value:
             self.result = "lose"
-            # Commented out for future purposes.
-            # self.dealer_wins += 1
         else:
             self.result = "push"
 
@@ -359,17 +915,54 @@ class Game21:
         if self.game_state != "player_turn":
             return
 
+        self.player_stood = True
         self.reveal_dealer_card()
         # play_dealer_turn will be called separately from UI
 
-    # Commented out for future purposes if statistics is needed.
-    # def get_statistics(self):
-    #     """
-    #     Returns the current game statistics
-    #     """
-    #     return {
-    #         'player_wins': self.player_wins,
-    #         'dealer_wins': self.dealer_wins,
-    #         'rounds_played': self.rounds_played,
-    #         'ties': self.rounds_played - self.player_wins - self.dealer_wins
-    #     }
\ No newline at end of file
+    def play_rounds(self, n, policy=mimic_dealer_policy, bet_policy=None):
+        """Play n complete rounds headlessly and return the aggregated counts.
+
+        This is the batch entry point for simulations. It follows the same rules as the step-by-step
+        methods above (player natural is settled at once, the player acts through `policy`, the dealer
+        plays to the table's rule) but runs the round engine compiled for this table's RuleSet,
+        working directly on card ids from the shoe, without building hands, game states or result
+        text. The shoe is shared with the interactive game, so call new_round() before dealing
+        interactively again.
+
+        `bet_policy`, if given, maps the shoe's true count before each round to that round's bet in
+        units (for count-aware betting); by default every round bets one unit.
+        """
+        if bet_policy is None:
+            return self._round_engine(self, n, policy, None)
+        return compile_round_engine(self.rules, count_bets=True)(self, n, policy, bet_policy)
+
+    def play_table_rounds(self, n, seats=MAX_SEATS, policy=mimic_dealer_policy, bet_policy=None):
+        """Play n rounds at a table of 1 to MAX_SEATS seats sharing this game's shoe.
+
+        Every seat plays `policy` and bets one unit (or bet_policy(true count) for all seats). The
+        results come back from new_table_stats(): per-seat arrays, seat 0 acting first. Like
+        play_rounds(), call new_round() before dealing interactively again.
+        """
+        if not 1 <= seats <= MAX_SEATS:
+            raise ValueError(f"seats must be between 1 and {MAX_SEATS}")
+        engine = compile_round_engine(self.rules, count_bets=bet_policy is not None, table=True)
+        return engine(self, n, policy, bet_policy, seats)
+
+    def round_net(self):
+        """Return of the finished round in bet units: the blackjack payout for a winning natural, else 1, -1 or 0."""
+        if self.result == "win":
+            return self.rules.blackjack_payout if self.player_hand.has_blackjack() else 1
+        if self.result == "lose":
+            return -1
+        return 0
+
+    def get_statistics(self):
+        """
+        Returns the current game statistics
+        """
+        return {
+            'player_wins': self.player_wins,
+            'dealer_wins': self.dealer_wins,
+            'rounds_played': self.rounds_played,
+            'ties': self.rounds_played - self.player_wins - self.dealer_wins
+        }
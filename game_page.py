@@ -1,7 +1,134 @@
+import sqlite3
+import threading
+
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
-from game_logic import Game21
+from game_logic import CARDS, SUIT_SYMBOLS, Game21
+from analytics import EVCancelled, hit_stand_ev, unseen_composition
+from running_stats import RunningStats
+from stats_store import DEFAULT_DB_PATH, StatsStore
+from tracing import DEBUG, tracer
+
+
+# This is the atlas index of the card back; card faces use their card id (0-51)
+HIDDEN_CARD = 52
+# This bounds how many atlases are kept, one per (theme, size, device pixel ratio)
+MAX_CARD_ATLASES = 4
+# This is how many days of saved results the statistics box lists, newest first
+STATISTICS_DAYS = 7
+
+# This maps (theme, width, height, device pixel ratio) to the 53 pre-rendered card pixmaps
+_card_atlases = {}
+# This holds the rank, suit and hidden-card fonts, shared by every card
+_card_fonts = None
+
+
+def _paint_card(painter, width, height, card, is_hidden, theme):
+    """Draw one card into a painter. We wrote this function so each card image is drawn once per atlas."""
+    global _card_fonts
+    if _card_fonts is None:
+        _card_fonts = (QFont("Arial", 24, QFont.Weight.Bold), QFont("Arial", 32, QFont.Weight.Bold),
+                       QFont("Arial", 24, QFont.Weight.Bold))
+    rank_font, suit_font, hidden_font = _card_fonts
+    rect = QRect(0, 0, width, height)
+
+    # This enables antialiasing for smoother graphics
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # This draws the card background with theme-aware colors
+    if theme == "dark":
+        # This uses dark blue for dark theme because we decided to go with a blue color palette
+        painter.setBrush(QBrush(QColor(44, 62, 80)))
+    else:
+        # This uses white for light theme
+        painter.setBrush(QBrush(QColor(255, 255, 255)))
+
+    # This sets a light gray border for the card
+    painter.setPen(QPen(QColor(189, 195, 199), 2))
+    # This draws a rounded rectangle for the card
+    painter.drawRoundedRect(2, 2, width - 4, height - 4, 10, 10)
+
+    if is_hidden:
+        # This draws a hidden card with blue background
+        painter.setBrush(QBrush(QColor(52, 152, 219)))
+        # This draws the inner blue rectangle
+        painter.drawRoundedRect(5, 5, width - 10, height - 10, 8, 8)
+        # This sets white color for the question mark
+        painter.setPen(QPen(QColor(255, 255, 255), 2))
+        # This uses the hidden font
+        painter.setFont(hidden_font)
+        # This draws a question mark in the center
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "?")
+    elif card:
+        # This determines card color based on suit
+        if card.suit in ['H', 'D']:
+            # This uses red for hearts and diamonds
+            color = QColor(231, 76, 60)
+        else:
+            # This uses dark blue for clubs and spades
+            color = QColor(52, 73, 94)
+
+        # This sets the pen color for card details
+        painter.setPen(QPen(color, 2))
+
+        # This gets the display text for the card
+        text = card.display_text
+        # This gets the Unicode suit symbol, which works across platforms without 52 card images
+        suit_symbol = SUIT_SYMBOLS[card.suit]
+
+        # This draws the rank in the top-left corner
+        painter.setFont(rank_font)
+        painter.drawText(10, 25, text)
+
+        # This draws a large suit symbol in the center
+        painter.setFont(suit_font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, suit_symbol)
+
+        # This draws the rank in the bottom-right corner (upside down)
+        painter.save()
+        # This moves to the bottom-right corner
+        painter.translate(width, height)
+        # This rotates 180 degrees for upside-down text
+        painter.rotate(180)
+        painter.setFont(rank_font)
+        # This draws the upside-down rank
+        painter.drawText(10, 25, text)
+        painter.restore()
+
+
+def card_atlas(theme, width, height, ratio):
+    """Return the 53 card pixmaps (faces by card id, then the back) for a theme, size and device pixel ratio.
+
+    The pixmaps are rendered on first use and cached, so painting a card is a single drawPixmap.
+    A theme or screen change asks for a different key, which renders a fresh atlas; the oldest atlas
+    is dropped once MAX_CARD_ATLASES are cached.
+    """
+    key = (theme, width, height, ratio)
+    atlas = _card_atlases.get(key)
+    if atlas is not None:
+        return atlas
+
+    atlas = []
+    for index in range(HIDDEN_CARD + 1):
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        is_hidden = index == HIDDEN_CARD
+        _paint_card(painter, width, height, None if is_hidden else CARDS[index], is_hidden, theme)
+        painter.end()
+        atlas.append(pixmap)
+
+    if len(_card_atlases) >= MAX_CARD_ATLASES:
+        del _card_atlases[next(iter(_card_atlases))]
+    _card_atlases[key] = atlas
+    return atlas
+
+
+def clear_card_atlases():
+    """Drop every cached card atlas, e.g. after the card colors or fonts change."""
+    _card_atlases.clear()
 
 
 class CardWidget(QWidget):
@@ -16,100 +143,157 @@ class CardWidget(QWidget):
         # This sets an object name for CSS styling
         self.setObjectName("cardWidget")
 
-        self.rank_font = QFont("Arial", 24, QFont.Weight.Bold)
-        self.suit_font = QFont("Arial", 32, QFont.Weight.Bold)
-        self.hidden_font = QFont("Arial", 24, QFont.Weight.Bold)
+    def set_card(self, card=None, is_hidden=False):
+        """Show a different card in this widget. We wrote this method so card widgets can be reused."""
+        if card is self.card and is_hidden == self.is_hidden:
+            return
+        self.card = card
+        self.is_hidden = is_hidden
+        self.update()
 
     def paintEvent(self, event):
-        # This creates a QPainter object for drawing
-        painter = QPainter(self)
-        # This enables antialiasing for smoother graphics
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # This draws the card background with theme-aware colors
-        if self.parent() and hasattr(self.parent(), 'current_theme'):
-            if self.parent().current_theme == "dark":
-                # This uses dark blue for dark theme because we decided to go with a blue color palette
-                painter.setBrush(QBrush(QColor(44, 62, 80)))
-            else:
-                # This uses white for light theme
-                painter.setBrush(QBrush(QColor(255, 255, 255)))
+        # This picks the theme from the parent, like the cards always have
+        theme = getattr(self.parent(), 'current_theme', "light")
+        if self.is_hidden:
+            index = HIDDEN_CARD
+        elif self.card:
+            index = self.card.id
         else:
-            # This sets white as default color
-            painter.setBrush(QBrush(QColor(255, 255, 255)))
+            # This paints a blank card face, which is rare enough to draw directly
+            painter = QPainter(self)
+            _paint_card(painter, self.width(), self.height(), None, False, theme)
+            return
 
-        # This sets a light gray border for the card
-        painter.setPen(QPen(QColor(189, 195, 199), 2))
-        # This draws a rounded rectangle for the card
-        painter.drawRoundedRect(2, 2, self.width() - 4, self.height() - 4, 10, 10)
+        # This blits the pre-rendered card
+        atlas = card_atlas(theme, self.width(), self.height(), self.devicePixelRatioF())
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, atlas[index])
 
-        if self.is_hidden:
-            # This draws a hidden card with blue background
-            painter.setBrush(QBrush(QColor(52, 152, 219)))
-            # This draws the inner blue rectangle
-            painter.drawRoundedRect(5, 5, self.width() - 10, self.height() - 10, 8, 8)
-            # This sets white color for the question mark
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
-            # This uses the hidden font
-            painter.setFont(self.hidden_font)
-            # This draws a question mark in the center
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "?")
-        elif self.card:
-            # This determines card color based on suit
-            suit = self.card.suit
-            if suit in ['H', 'D']:
-                # This uses red for hearts and diamonds
-                color = QColor(231, 76, 60)
+
+class CardRow:
+    """The card widgets of one hand. We created this class to reuse card widgets instead of deleting them each round.
+
+    Widgets are created the first time a hand grows that long and then kept in the layout: a new
+    round rebinds them to the new cards and hides the ones it does not need. A hand can never hold
+    more than MAX_HAND_CARDS cards, so the row never grows beyond that.
+    """
+
+    # This is the longest possible hand: 21 Aces and one more card
+    MAX_HAND_CARDS = 22
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.widgets = []
+        self.shown = 0
+
+    def append(self, card, is_hidden=False):
+        """Show one more card at the end of the row."""
+        if self.shown == len(self.widgets):
+            if len(self.widgets) >= self.MAX_HAND_CARDS:
+                raise ValueError("too many cards for one hand")
+            widget = CardWidget(card, is_hidden)
+            self.layout.addWidget(widget)
+            self.widgets.append(widget)
+        else:
+            widget = self.widgets[self.shown]
+            widget.set_card(card, is_hidden)
+            widget.show()
+        self.shown += 1
+
+    def show_cards(self, cards):
+        """Show exactly these (card, is_hidden) pairs, reusing the existing widgets."""
+        previous = self.shown
+        self.shown = 0
+        for card, is_hidden in cards:
+            if self.shown < previous:
+                # This rebinds a widget that is already showing, so it is not hidden and shown again
+                self.widgets[self.shown].set_card(card, is_hidden)
+                self.shown += 1
             else:
-                # This uses dark blue for clubs and spades
-                color = QColor(52, 73, 94)
-
-            # This sets the pen color for card details
-            painter.setPen(QPen(color, 2))
-
-            # This gets the display text for the card
-            text = self.card.get_display_text()
-            # This creates suit symbols using Unicode characters
-            # We used Unicode because it provides proper suit symbols that work across platforms and it is easier than using 52 images of cards.
-            suit_symbols = {'H': '♥', 'D': '♦', 'C': '♣', 'S': '♠'}
-            # This looks up the Unicode symbol for the suit
-            suit_symbol = suit_symbols[suit]
-
-            # This draws the rank in the top-left corner
-            painter.setFont(self.rank_font)
-            painter.drawText(10, 25, text)
-
-            # This draws a large suit symbol in the center
-            painter.setFont(self.suit_font)
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, suit_symbol)
-
-            # This draws the rank in the bottom-right corner (upside down)
-            painter.save()
-            # This moves to the bottom-right corner
-            painter.translate(self.width(), self.height())
-            # This rotates 180 degrees for upside-down text
-            painter.rotate(180)
-            painter.setFont(self.rank_font)
-            # This draws the upside-down rank
-            painter.drawText(10, 25, text)
-            painter.restore()
+                self.append(card, is_hidden)
+        for widget in self.widgets[self.shown:previous]:
+            widget.hide()
+
+
+def summary_text(summary):
+    """One line of text for a StatsStore summary."""
+    return (f"{summary['rounds']} rounds, {summary['wins']} wins, {summary['losses']} losses, "
+            f"{summary['pushes']} ties")
+
+
+class EVSignals(QObject):
+    """Signals for the EV worker. They live on the GUI thread so results arrive as queued events."""
+    # This carries the request generation and the Hit and Stand expected values
+    finished = pyqtSignal(int, float, float)
+
+
+class EVWorker(QRunnable):
+    """Computes the exact Hit and Stand EV off the GUI thread. We created this class so the window never freezes."""
+
+    def __init__(self, generation, hard, has_ace, upcard, composition, rules, cancelled, signals):
+        super().__init__()
+        # This stores a snapshot of the hand and shoe, so the worker never touches the live game
+        self.generation = generation
+        self.hard = hard
+        self.has_ace = has_ace
+        self.upcard = upcard
+        self.composition = composition
+        self.rules = rules
+        # This is a threading.Event set by the page when the game state changes
+        self.cancelled = cancelled
+        self.signals = signals
+
+    def run(self):
+        # This skips the work if the request was cancelled while queued
+        if self.cancelled.is_set():
+            return
+        try:
+            hit_ev, stand_ev = hit_stand_ev(self.hard, self.has_ace, self.upcard, self.composition,
+                                           self.rules.dealer_hits_soft_17, self.rules.num_decks,
+                                           self.cancelled)
+        except EVCancelled:
+            # This frees the pool for the request that replaced this one
+            return
+        # This drops the result if the state changed while computing
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.generation, hit_ev, stand_ev)
 
 
 class GamePage(QWidget):
     """Main game page"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, stats_path=DEFAULT_DB_PATH):
         super().__init__(parent)
         self.parent_window = parent
         self.game = Game21()
+        # This keeps streaming win rates and returns for the session, fed once per finished round
+        self.round_stats = RunningStats()
+        self.game.round_listeners.append(self.round_stats)
+        # This saves every finished round to the statistics database in the background
+        # (stats_path=None turns the database off)
+        self.stats_store = None
+        if stats_path is not None:
+            try:
+                self.stats_store = StatsStore(stats_path)
+                self.game.round_listeners.append(self.stats_store)
+            except (OSError, sqlite3.Error) as e:
+                tracer.error("Could not open the statistics database: %s", e)
         # This sets the initial theme to light mode
         self.current_theme = "light"
         # This tracks the current game state
         self.current_state = "idle"
         # This tracks the current game result
         self.current_result = "none"
+        # This creates a single background thread for EV calculations
+        self.ev_pool = QThreadPool(self)
+        self.ev_pool.setMaxThreadCount(1)
+        self.ev_signals = EVSignals()
+        self.ev_signals.finished.connect(self.on_ev_ready)
+        # This numbers EV requests so results for an outdated state are ignored
+        self.ev_generation = 0
+        self.ev_cancelled = None
         self.init_ui()
-        print(f" GamePage created with theme: {self.current_theme}")
+        tracer.info("GamePage created with theme %s", self.current_theme)
 
     def init_ui(self):
         """Initialize the game interface"""
@@ -156,6 +340,15 @@ class GamePage(QWidget):
         # This connects the button click to the go_to_welcome method
         self.back_button.clicked.connect(self.go_to_welcome)
         theme_layout.addWidget(self.back_button)
+
+        # This creates a button showing the results saved for this session, by day and overall
+        self.stats_button = QPushButton("Statistics")
+        self.stats_button.setObjectName("statsButton")
+        self.stats_button.setFont(QFont("Arial", 12))
+        self.stats_button.setFixedSize(150, 40)
+        self.stats_button.setToolTip("Show your saved results")
+        self.stats_button.clicked.connect(self.show_statistics)
+        theme_layout.addWidget(self.stats_button)
         # This adds stretchable space on the right
         theme_layout.addStretch()
         # This adds the theme layout to the main layout
@@ -173,7 +366,7 @@ class GamePage(QWidget):
 
     def toggle_theme(self):
         """Toggle theme globally through main window"""
-        print(f" Theme button clicked. Current theme: {self.current_theme}")
+        tracer.debug("Theme button clicked, current theme %s", self.current_theme, action="toggle_theme")
 
         # This checks if parent window has toggle_theme method
         if self.parent_window and hasattr(self.parent_window, 'toggle_theme'):
@@ -182,15 +375,16 @@ class GamePage(QWidget):
         else:
             # This provides fallback if parent window doesn't exist
             new_theme = "dark" if self.current_theme == "light" else "light"
-            print(f" Switching to {new_theme} theme (fallback)")
+            tracer.debug("Switching to %s theme (fallback)", new_theme, action="toggle_theme")
             # This calls the local set_theme method
             self.set_theme(new_theme)
 
     def set_theme(self, theme):
         """Set the theme for the game page. We wrote this method to ensure all child widgets get the theme property."""
-        # This prints which theme is being set
-        print(f" Setting theme to: {theme}")
+        with tracer.span("Set game page theme to %s", theme, action="set_theme"):
+            self._set_theme(theme)
 
+    def _set_theme(self, theme):
         # This updates the current theme variable
         self.current_theme = theme
 
@@ -218,12 +412,13 @@ class GamePage(QWidget):
 
         # This forces a UI update to reflect theme changes
         self.update()
-        print(f" Theme set complete. Current theme: {self.current_theme}")
 
     def set_game_state(self, state, result="none"):
         """Set the game state for styling. We wrote this method to allow CSS to style different game states."""
-        # This prints the state and result being set
-        print(f" Setting game state: {state}, result: {result}")
+        # This skips working out the round id when debug tracing is off
+        if tracer.enabled(DEBUG):
+            tracer.debug("Game state %s, result %s", state, result, action="set_game_state",
+                         round_id=self.game.round_id)
         # This updates the current state and result
         self.current_state = state
         self.current_result = result
@@ -245,7 +440,6 @@ class GamePage(QWidget):
         if hasattr(self, 'result_label'):
             self.result_label.style().unpolish(self.result_label)
             self.result_label.style().polish(self.result_label)
-        print(f" Game state updated")
 
     def create_game_area(self):
         """Create the main game area. We wrote this method to organize the game layout into separate sections."""
@@ -264,8 +458,15 @@ class GamePage(QWidget):
         self.dealer_total_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         dealer_layout.addWidget(self.dealer_total_label)
 
+        # This creates a label to show the Hi-Lo count of the cards seen so far
+        self.count_label = QLabel("Count: --")
+        self.count_label.setObjectName("countLabel")
+        self.count_label.setFont(QFont("Arial", 12))
+        dealer_layout.addWidget(self.count_label)
+
         # This creates a layout to hold dealer's cards
         self.dealer_cards_layout = QHBoxLayout()
+        self.dealer_cards = CardRow(self.dealer_cards_layout)
         dealer_layout.addLayout(self.dealer_cards_layout)
         dealer_group.setLayout(dealer_layout)
 
@@ -289,8 +490,15 @@ class GamePage(QWidget):
         self.player_total_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         player_layout.addWidget(self.player_total_label)
 
+        # This creates a label to show the expected value of Hit and Stand
+        self.ev_label = QLabel("")
+        self.ev_label.setObjectName("evLabel")
+        self.ev_label.setFont(QFont("Arial", 12))
+        player_layout.addWidget(self.ev_label)
+
         # This creates a layout to hold player's cards
         self.player_cards_layout = QHBoxLayout()
+        self.player_cards = CardRow(self.player_cards_layout)
         player_layout.addLayout(self.player_cards_layout)
         player_group.setLayout(player_layout)
 
@@ -333,6 +541,16 @@ class GamePage(QWidget):
         self.new_round_button.clicked.connect(self.on_new_round)
         layout.addWidget(self.new_round_button)
 
+        # This creates the Hint button, which suggests the basic-strategy move
+        self.hint_button = QPushButton("Hint")
+        self.hint_button.setObjectName("hintButton")
+        self.hint_button.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.hint_button.setFixedSize(120, 50)
+        self.hint_button.setToolTip("Show the basic-strategy move for your hand")
+        # This connects the Hint button to the on_hint method
+        self.hint_button.clicked.connect(self.on_hint)
+        layout.addWidget(self.hint_button)
+
         # This adds stretchable space on the right
         layout.addStretch()
         return controls
@@ -354,31 +572,108 @@ class GamePage(QWidget):
                 # This calls the parent window's method to show welcome page
                 self.parent_window.show_welcome_page()
 
+    def show_statistics(self):
+        """Show the session, daily and lifetime results. We wrote this method so saved results outlive a restart."""
+        # This is the live session, straight from the in-memory counters
+        stats = self.round_stats
+        win_low, win_high = stats.rate_interval("win")
+        text = (f"<b>This session:</b> {stats.count} rounds, {stats.wins} wins, {stats.losses} losses, "
+                f"{stats.pushes} ties<br>Win rate {stats.rate('win') * 100:.1f}% "
+                f"(95% CI {win_low * 100:.1f}-{win_high * 100:.1f}%)<br><br>")
+
+        if self.stats_store is None:
+            text += "Saved statistics are not available."
+        else:
+            try:
+                # This reads whatever the background writer has committed so far
+                session = self.stats_store.session_summary()
+                days = self.stats_store.daily_summaries()[:STATISTICS_DAYS]
+                lifetime = self.stats_store.lifetime_summary()
+            except sqlite3.Error as e:
+                tracer.error("Could not read the statistics database: %s", e)
+                text += "The saved statistics could not be read."
+            else:
+                text += f"<b>Saved this session:</b> {summary_text(session)}<br><br><b>By day:</b><br>"
+                text += "".join(f"{day['day']}: {summary_text(day)}<br>" for day in days) or "No saved rounds yet<br>"
+                text += f"<br><b>All sessions:</b> {summary_text(lifetime)}"
+
+        QMessageBox.information(self, "Statistics", text)
+
     # The blocks of codes below deals with the button actions.
+    # The blocks of code below run the EV calculation in the background.
+    def start_ev_calculation(self):
+        """Start computing the Hit and Stand EV. We wrote this method to keep the calculation off the GUI thread."""
+        # This cancels any calculation for the previous state
+        self.cancel_ev_calculation()
+        if self.game.game_state != "player_turn" or not self.game.dealer_hand.cards:
+            return
+        upcard = self.game.dealer_hand.cards[0]
+        self.ev_cancelled = threading.Event()
+        # This snapshots the hand, upcard and unseen cards for the worker
+        worker = EVWorker(self.ev_generation, self.game.player_hand.hard_total, self.game.player_hand.aces > 0,
+                          11 if upcard.is_ace else upcard.value, unseen_composition(self.game),
+                          self.game.rules, self.ev_cancelled, self.ev_signals)
+        self.ev_label.setText("EV: calculating...")
+        self.ev_pool.start(worker)
+
+    def cancel_ev_calculation(self):
+        """Cancel the pending EV calculation. We wrote this method for every action that changes the state."""
+        self.ev_generation += 1
+        if self.ev_cancelled:
+            self.ev_cancelled.set()
+            self.ev_cancelled = None
+        # This removes a request that has not started yet
+        self.ev_pool.clear()
+        self.ev_label.setText("")
+
+    def on_ev_ready(self, generation, hit_ev, stand_ev):
+        """Show a finished EV calculation, unless the state has changed since it was requested."""
+        if generation != self.ev_generation:
+            return
+        self.ev_label.setText(f"EV  Hit: {hit_ev:+.3f}   Stand: {stand_ev:+.3f}")
+
     def on_hit(self):
         """Player takes a card. We wrote this method to handle player drawing a card."""
+        # This cancels the EV calculation for the old hand
+        self.cancel_ev_calculation()
         # This sets the game state to player's turn
         self.set_game_state("player_turn")
         # This gets a card from the game logic
         card = self.game.player_hit()
         if card:
-            # This creates a card widget for the drawn card
-            card_widget = CardWidget(card)
-            # This adds the card widget to player's cards layout
-            self.player_cards_layout.addWidget(card_widget)
+            # This shows the drawn card in the player's row
+            self.player_cards.append(card)
 
             # This calculates player's total
             player_total = self.game.player_total()
             # This updates the player total label
             self.player_total_label.setText(f"Total: {player_total}")
+            self.update_count_label()
 
             # This checks if player is bust
             if self.game.player_hand.is_bust():
                 # This calls method to handle game finished state
                 self.game_state_finished()
+            else:
+                # This starts the EV calculation for the new hand
+                self.start_ev_calculation()
+
+    def on_hint(self):
+        """Show the recommended move. We wrote this method to look up the precomputed strategy table."""
+        # This gets the recommended action from the game logic
+        action = self.game.recommended_action()
+        if action is None:
+            return
+        # This shows the hint in the result label and the status bar
+        self.result_label.setText(f"Hint: {action.capitalize()}")
+        if self.parent_window and hasattr(self.parent_window, 'status_bar'):
+            self.parent_window.status_bar.showMessage(
+                f"Basic strategy says {action} on {self.game.player_total()}.")
 
     def on_stand(self):
         """Player ends turn. We wrote this method to handle player ending their turn and starting dealer's turn."""
+        # This cancels the EV calculation, the player's turn is over
+        self.cancel_ev_calculation()
         # This sets the game state to dealer's turn
         self.set_game_state("dealer_turn")
         # This calls game logic for player standing
@@ -386,14 +681,16 @@ class GamePage(QWidget):
         # This updates dealer cards to show the hidden card
         self.update_dealer_cards(full=True)
 
-        # This disables Hit and Stand buttons during dealer's turn
+        # This disables Hit, Stand and Hint buttons during dealer's turn
         self.hit_button.setEnabled(False)
         self.stand_button.setEnabled(False)
+        self.hint_button.setEnabled(False)
 
         # This gets dealer's total
         dealer_total = self.game.dealer_total()
         # This updates the dealer total label
         self.dealer_total_label.setText(f"Total: {dealer_total}")
+        self.update_count_label()
 
         # This updates the result label
         self.result_label.setText("Dealer's turn...")
@@ -403,6 +700,8 @@ class GamePage(QWidget):
 
     def on_new_round(self):
         """Start a new round. We wrote this method to reset the game for a new round."""
+        # This cancels the EV calculation for the previous round
+        self.cancel_ev_calculation()
         # This calls game logic to start a new round
         self.game.new_round()
         # This sets up the UI for the new round
@@ -422,10 +721,8 @@ class GamePage(QWidget):
 
     def add_dealer_card(self, card):
         """Add a card to dealer's hand display. We wrote this method to add cards with visual feedback."""
-        # This creates a card widget for the dealer's card
-        card_widget = CardWidget(card)
-        # This adds the card widget to dealer's cards layout
-        self.dealer_cards_layout.addWidget(card_widget)
+        # This shows the card in the dealer's row
+        self.dealer_cards.append(card)
         # This updates the dealer total label
         dealer_total = self.game.dealer_total()
         self.dealer_total_label.setText(f"Total: {dealer_total}")
@@ -436,6 +733,8 @@ class GamePage(QWidget):
         dealer_total = self.game.dealer_total()
         # This updates dealer total label
         self.dealer_total_label.setText(f"Total: {dealer_total}")
+        # This updates the count once every dealer card is on the table
+        self.update_count_label()
 
         # This gets the result text from game logic
         result_text = self.game.decide_winner()
@@ -477,9 +776,10 @@ class GamePage(QWidget):
         else:
             self.set_game_state("finished", "push")
 
-        # This disables Hit and Stand buttons
+        # This disables Hit, Stand and Hint buttons
         self.hit_button.setEnabled(False)
         self.stand_button.setEnabled(False)
+        self.hint_button.setEnabled(False)
         # This enables the New Round button
         self.new_round_button.setEnabled(True)
 
@@ -493,68 +793,51 @@ class GamePage(QWidget):
                 self.parent_window.status_bar.showMessage("It's a tie! The round ends in a push.")
 
 
-    def clear_layout(self, layout):
-        """Remove all widgets from a layout. We wrote this method to clean up layouts before adding new cards."""
-        # This loops through all items in the layout
-        while layout.count():
-            # This takes the first item from the layout
-            child = layout.takeAt(0)
-            if child.widget():
-                # This deletes the widget
-                child.widget().deleteLater()
+    def update_count_label(self):
+        """Show the Hi-Lo count. We wrote this method so the count never includes the hidden card."""
+        running_count, true_count = self.game.visible_count()
+        self.count_label.setText(f"Count  Running: {running_count:+d}   True: {true_count:+.1f}")
 
     def update_dealer_cards(self, full=False):
         """Show dealer cards. We wrote this method to hide the first card until revealed."""
-        # This clears the current dealer cards layout
-        self.clear_layout(self.dealer_cards_layout)
-
         # This checks if we should show all dealer cards
         if full or self.game.game_state in ["dealer_turn", "finished"]:
             # This shows all dealer cards
-            for card in self.game.dealer_hand.cards:
-                card_widget = CardWidget(card)
-                self.dealer_cards_layout.addWidget(card_widget)
+            cards = [(card, False) for card in self.game.dealer_hand.cards]
         else:
             # This shows only the first dealer card
-            if self.game.dealer_hand.cards:
-                card_widget = CardWidget(self.game.dealer_hand.cards[0])
-                self.dealer_cards_layout.addWidget(card_widget)
-
+            cards = [(card, False) for card in self.game.dealer_hand.cards[:1]]
             # This shows a hidden card for the second card
             if self.game.dealer_hand.face_down_card:
-                hidden_widget = CardWidget(is_hidden=True)
-                self.dealer_cards_layout.addWidget(hidden_widget)
+                cards.append((None, True))
+        self.dealer_cards.show_cards(cards)
 
     def new_round_setup(self):
         """Prepare a fresh visual layout. We wrote this method to reset the UI for a new round."""
-        # This clears player's and dealer's card layouts
-        self.clear_layout(self.player_cards_layout)
-        self.clear_layout(self.dealer_cards_layout)
-
         # This deals initial cards
         self.game.deal_initial_cards()
         # This updates dealer cards
         self.update_dealer_cards(full=False)
 
-        # This adds player's initial cards
-        for card in self.game.player_hand.cards:
-            card_widget = CardWidget(card)
-            self.player_cards_layout.addWidget(card_widget)
+        # This shows player's initial cards, reusing the previous round's card widgets
+        self.player_cards.show_cards([(card, False) for card in self.game.player_hand.cards])
 
         # This updates player's total label
         player_total = self.game.player_total()
         self.player_total_label.setText(f"Total: {player_total}")
         # This sets dealer's total to unknown
         self.dealer_total_label.setText("Total: ?")
+        self.update_count_label()
 
         # This checks for immediate win/loss conditions
         if self.game.game_state == "finished":
             # This gets the result text
             result_text = self.game.decide_winner()
             self.result_label.setText(result_text)
-            # This disables Hit and Stand buttons
+            # This disables Hit, Stand and Hint buttons
             self.hit_button.setEnabled(False)
             self.stand_button.setEnabled(False)
+            self.hint_button.setEnabled(False)
             # This enables New Round button
             self.new_round_button.setEnabled(True)
 
@@ -577,11 +860,14 @@ class GamePage(QWidget):
             if self.parent_window and hasattr(self.parent_window, 'status_bar'):
                 self.parent_window.status_bar.showMessage(
                     "Your turn. Click Hit to draw a card or Stand to end your turn.")
-            # This enables Hit and Stand buttons
+            # This enables Hit, Stand and Hint buttons
             self.hit_button.setEnabled(True)
             self.stand_button.setEnabled(True)
+            self.hint_button.setEnabled(True)
             # This disables New Round button during active round
             self.new_round_button.setEnabled(False)
+            # This starts the EV calculation for the opening hand
+            self.start_ev_calculation()
 
     def update_ui(self):
         """Update the UI based on game state. We wrote this method as a placeholder for future UI updates."""
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import gc
+import random
+import time
+
+from game_logic import Game21, RuleSet
+
+
+# This sets the histogram precision: 2**SUB_BUCKET_BITS buckets per power of two (under 1% error)
+SUB_BUCKET_BITS = 8
+HALF_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)
+# This covers latencies up to 2**48 ns (about three days)
+MAX_SHIFT = 48 - SUB_BUCKET_BITS
+
+ACTIONS = ('deal', 'hit', 'stand', 'dealer')
+REPORT_PERCENTILES = (50, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram. We created this class to keep tail latencies exact enough.
+
+    Values are nanoseconds. Below 2**SUB_BUCKET_BITS every value has its own bucket; above that
+    each power of two is split into HALF_BUCKETS equal buckets, so recording is O(1), memory is
+    fixed and any percentile is within about 1% of the true value.
+    """
+
+    def __init__(self):
+        self.counts = [0] * ((MAX_SHIFT + 2) * HALF_BUCKETS)
+        self.count = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket_index(value):
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+        return shift * HALF_BUCKETS + (value >> shift)
+
+    @staticmethod
+    def bucket_value(index):
+        """Middle of the range of values a bucket holds."""
+        if index < 2 * HALF_BUCKETS:
+            return index
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        return ((index - shift * HALF_BUCKETS) << shift) + (1 << shift) // 2
+
+    def record(self, value):
+        self.counts[self.bucket_index(min(value, (1 << (MAX_SHIFT + SUB_BUCKET_BITS)) - 1))] += 1
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Add another histogram's values to this one and return self."""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, percent):
+        """Latency in nanoseconds at or below which `percent` of the recorded values fall."""
+        if self.count == 0:
+            return 0
+        target = max(1, int(self.count * percent / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_value(index), self.max)
+        return self.max
+
+
+class GCPauseMonitor:
+    """Records how long each garbage collection pauses the event loop, through gc.callbacks."""
+
+    def __init__(self):
+        self.pauses = LatencyHistogram()
+        self.collections = [0, 0, 0]
+        self.started = 0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter_ns()
+        else:
+            self.pauses.record(time.perf_counter_ns() - self.started)
+            self.collections[info["generation"]] += 1
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self)
+
+
+async def simulated_player(game, rounds, histograms):
+    """Play `rounds` rounds like a client would, timing each engine action and yielding in between."""
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        game.new_round()
+        start = clock()
+        game.deal_initial_cards()
+        histograms['deal'].record(clock() - start)
+        await asyncio.sleep(0)
+
+        # This hits below 17, like the dealer
+        while game.game_state == "player_turn" and game.player_total() < 17:
+            start = clock()
+            game.player_hit()
+            histograms['hit'].record(clock() - start)
+            await asyncio.sleep(0)
+
+        if game.game_state == "player_turn":
+            start = clock()
+            game.player_stand()
+            histograms['stand'].record(clock() - start)
+            await asyncio.sleep(0)
+            start = clock()
+            game.play_dealer_turn()
+            histograms['dealer'].record(clock() - start)
+            await asyncio.sleep(0)
+
+
+async def run_load(players=1000, rounds=100, rules=None, seed=None):
+    """Run `players` concurrent simulated players for `rounds` rounds each and return a report dict.
+
+    Every player has its own Game21; all of them share one event loop, so the numbers include
+    scheduling and garbage-collection effects a single-threaded microbenchmark would not show.
+    """
+    rng = random.Random(seed)
+    games = [Game21(rng=random.Random(rng.getrandbits(64)), rules=rules) for _ in range(players)]
+    histograms = {action: LatencyHistogram() for action in ACTIONS}
+
+    with GCPauseMonitor() as gc_monitor:
+        start = time.perf_counter()
+        await asyncio.gather(*(simulated_player(game, rounds, histograms) for game in games))
+        elapsed = time.perf_counter() - start
+
+    report = {
+        'players': players,
+        'rounds': players * rounds,
+        'seconds': elapsed,
+        'rounds_per_second': players * rounds / elapsed,
+        'gc_collections': gc_monitor.collections,
+        'gc_pause_us': latency_summary(gc_monitor.pauses),
+    }
+    for action, histogram in histograms.items():
+        report[f'{action}_us'] = latency_summary(histogram)
+    return report
+
+
+def latency_summary(histogram):
+    """Count, percentiles and maximum of a histogram, in microseconds."""
+    summary = {'count': histogram.count}
+    for percent in REPORT_PERCENTILES:
+        summary[f'p{percent:g}'] = histogram.percentile(percent) / 1000
+    summary['max'] = histogram.max / 1000
+    return summary
+
+
+def main():
+    """Command-line entry point for load runs."""
+    parser = argparse.ArgumentParser(description="Drive many concurrent simulated players against Game21")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per player")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--decks", type=int, default=1)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args.players, args.rounds, RuleSet(args.h17, args.decks), args.seed))
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,44 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
+import argparse
 import sys
 import os
 
 from welcome_page import WelcomePage
 from game_page import GamePage
+from stats_store import DEFAULT_DB_PATH
+from sampler import DEFAULT_OUTPUT, PROFILE_ENV, StackSampler, output_path
+from tracing import tracer
 
 
 def load_stylesheet(filename):
     """This method loads and returns the QSS stylesheet from a file"""
     try:
         if not os.path.exists(filename): # This checks if the stylesheet file exists in the file system.
-            print(f" ERROR: Stylesheet file '{filename}' not found!")
+            tracer.error("Stylesheet file '%s' not found", filename)
             return ""
 
         # This opens the file for reading.
         with open(filename, 'r', encoding='utf-8') as f:
             # This reads the entire content of the stylesheet file
             content = f.read()
-            print(f" Successfully loaded '{filename}' ({len(content)} chars)")
+            tracer.info("Loaded '%s' (%d chars)", filename, len(content))
             return content
     except Exception as e:
-        print(f" ERROR loading stylesheet: {e}")
+        tracer.error("Could not load stylesheet: %s", e)
         return ""
 
 
 class MainWindow(QMainWindow):
     """This is the main application window that manages the page navigation"""
 
-    def __init__(self):
+    def __init__(self, stats_path=DEFAULT_DB_PATH):
         # This calls the parent class constructor
         super().__init__()
-        print(" MainWindow initializing...")
         # This sets the initial theme to light mode
         self.current_theme = "light"
+        # This is where the game page saves its statistics (None turns saving off)
+        self.stats_path = stats_path
         # This calls the method to set up the user interface
         self.init_ui()
 
@@ -59,7 +64,7 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.welcome_page)
 
         # This creates the game page instance
-        self.game_page = GamePage(self)
+        self.game_page = GamePage(self, self.stats_path)
         # This adds the game page to the stacked widget
         self.stacked_widget.addWidget(self.game_page)
 
@@ -69,13 +74,16 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.welcome_page)
 
         self.status_bar.showMessage("Welcome to ZA Great and Victor's 21 Card Game! Click 'Start Game' to begin.")
-        # This prints a completion message
-        print(" MainWindow initialization complete")
+        # This dumps the recent trace events to the console on demand
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=tracer.dump)
+        tracer.info("MainWindow created")
 
     def apply_theme_to_all(self, theme):
         """This method applies a theme to all pages and the main window. We did this, so the changing themes can be smooter. """
-        print(f" Applying {theme} theme to all pages...")
+        with tracer.span("Applied %s theme to all pages", theme, action="apply_theme"):
+            self._apply_theme_to_all(theme)
 
+    def _apply_theme_to_all(self, theme):
         # This applies the theme to the main window
         self.current_theme = theme
         # This sets a CSS property for styling
@@ -107,14 +115,28 @@ class MainWindow(QMainWindow):
         self.status_bar.style().unpolish(self.status_bar)
         self.status_bar.style().polish(self.status_bar)
 
-        # This prints a completion message
-        print(f" Theme {theme} applied globally")
+    def closeEvent(self, event):
+        """This method saves any queued statistics before the window closes"""
+        # This records the session's results with their 95% confidence intervals
+        stats = self.game_page.round_stats
+        if stats.count:
+            win_low, win_high = stats.rate_interval("win")
+            return_low, return_high = stats.mean_interval()
+            tracer.info("Session: %d rounds, win rate %.3f (%.3f-%.3f), mean return %+.3f (%+.3f to %+.3f)",
+                        stats.count, stats.rate("win"), win_low, win_high, stats.mean, return_low, return_high,
+                        action="session_summary")
+        if self.game_page.stats_store:
+            self.game_page.stats_store.close()
+        # This stops any EV calculation so its thread never outlives the page
+        self.game_page.cancel_ev_calculation()
+        self.game_page.ev_pool.waitForDone()
+        super().closeEvent(event)
 
     def toggle_theme(self):
         """This method toggles the theme between light and dark"""
         # This determines the new theme based on the current one
         new_theme = "dark" if self.current_theme == "light" else "light"
-        print(f" Toggling theme from {self.current_theme} to {new_theme}")
+        tracer.debug("Toggling theme from %s to %s", self.current_theme, new_theme, action="toggle_theme")
 
         # This applies the new theme to all components
         self.apply_theme_to_all(new_theme)
@@ -143,17 +165,26 @@ class MainWindow(QMainWindow):
 
 def main():
     """This is the main application entry point"""
-    app = QApplication(sys.argv)
-    print(" STARTING 21 CARD GAME APPLICATION")
+    # This reads our own flags and leaves the rest for Qt
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_OUTPUT, default=os.environ.get(PROFILE_ENV))
+    args, qt_args = parser.parse_known_args(sys.argv[1:])
+    app = QApplication([sys.argv[0]] + qt_args)
+    # This dumps the recent trace events if the app crashes
+    tracer.install_crash_handler()
+    tracer.info("Starting 21 card game application")
+
+    # This starts the sampling profiler when it was asked for
+    profile_path = output_path(args.profile)
+    sampler = StackSampler().start() if profile_path else None
 
     # This sets the application style to Fusion for consistent look
     app.setStyle("Fusion")
     stylesheet = load_stylesheet("style.qss")
     if stylesheet: # This checks if the stylesheet was loaded successfully
         app.setStyleSheet(stylesheet)
-        print(" Global stylesheet applied successfully")
     else:
-        print(" No stylesheet applied - using default styling")
+        tracer.warning("No stylesheet applied - using default styling")
 
     font = QFont("Arial", 10)
     app.setFont(font)
@@ -161,8 +192,17 @@ def main():
     window = MainWindow()
     window.show()
 
-    print("  Application is now running")
-    sys.exit(app.exec())
+    tracer.info("Application is running")
+    exit_code = app.exec()
+
+    # This writes the profile once the window has closed
+    if sampler:
+        sampler.stop()
+        sampler.write_collapsed(profile_path)
+        print(f" Profile written to '{profile_path}' ({sampler.total} samples)")
+        for name, (samples, milliseconds) in sampler.summary().items():
+            print(f"   {name}: {samples} samples, ~{milliseconds:.0f} ms")
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,129 @@
+import mmap
+import struct
+
+from replay import RESULT_CODES, STOOD_FLAG
+
+
+# This identifies a journal file; the header is padded to one record so records stay aligned
+JOURNAL_MAGIC = b"BJJOURN1"
+MAX_CARDS = 11
+NO_CARD = 0xFF
+
+# This is one round, 32 bytes:
+#   player card count, player card ids (padded with NO_CARD),
+#   dealer card count, dealer card ids (upcard, hole card, then draws),
+#   dealer draws, player actions (hits plus STOOD_FLAG), result code, 5 reserved bytes
+RECORD = struct.Struct(f"<B{MAX_CARDS}sB{MAX_CARDS}sBBB5x")
+RECORD_SIZE = RECORD.size
+HEADER = struct.Struct(f"<8s{RECORD_SIZE - 8}x")
+
+# This gives the byte offset of each single-byte field inside a record
+PLAYER_COUNT = 0
+PLAYER_CARDS = 1
+DEALER_COUNT = PLAYER_CARDS + MAX_CARDS
+DEALER_CARDS = DEALER_COUNT + 1
+DEALER_DRAWS = DEALER_CARDS + MAX_CARDS
+ACTIONS = DEALER_DRAWS + 1
+RESULT = ACTIONS + 1
+FIELDS = {
+    'player_count': PLAYER_COUNT,
+    'dealer_count': DEALER_COUNT,
+    'dealer_draws': DEALER_DRAWS,
+    'actions': ACTIONS,
+    'result': RESULT,
+}
+
+
+def _card_bytes(cards):
+    """Card ids of a hand as fixed-width bytes; hands longer than MAX_CARDS are truncated."""
+    ids = bytes(card.id for card in cards[:MAX_CARDS])
+    return ids + bytes([NO_CARD]) * (MAX_CARDS - len(ids))
+
+
+def pack_round(game):
+    """Pack the finished round of a Game21 into one fixed-width journal record."""
+    player_cards = game.player_hand.cards
+    dealer_cards = game.dealer_hand.cards
+    actions = game.player_hits | (STOOD_FLAG if game.player_stood else 0)
+    return RECORD.pack(len(player_cards), _card_bytes(player_cards),
+                       len(dealer_cards), _card_bytes(dealer_cards),
+                       max(0, len(dealer_cards) - 2), actions, RESULT_CODES[game.result])
+
+
+class RoundJournal:
+    """Appends every finished round of a Game21 to a binary journal. We created this class for analytics.
+
+    Attach it with game.round_listeners.append(journal). Records are fixed-width, so a reader can
+    jump straight to any round or field without parsing the rounds before it.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "ab")
+        # This writes the header for a new journal
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(JOURNAL_MAGIC))
+
+    def __call__(self, game):
+        self.file.write(pack_round(game))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JournalReader:
+    """Reads a round journal through a memory map, without copying or parsing the records.
+
+    Iterating yields a memoryview per record; use the field offsets above (e.g. record[RESULT]) to
+    read from it. column() gives a strided view of one field across every record.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(JOURNAL_MAGIC)] != JOURNAL_MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a round journal")
+        # This ignores a partly written record at the end of the file
+        self.count = (len(self.map) - HEADER.size) // RECORD_SIZE
+        self.view = memoryview(self.map)[HEADER.size:HEADER.size + self.count * RECORD_SIZE]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError("journal record index out of range")
+        start = (index % self.count) * RECORD_SIZE
+        return self.view[start:start + RECORD_SIZE]
+
+    def __iter__(self):
+        view = self.view
+        for start in range(0, self.count * RECORD_SIZE, RECORD_SIZE):
+            yield view[start:start + RECORD_SIZE]
+
+    def column(self, name):
+        """Zero-copy view of one single-byte field (see FIELDS) across every record."""
+        return self.view[FIELDS[name]::RECORD_SIZE]
+
+    def result_counts(self):
+        """Number of rounds per result name, counted in C over the result column."""
+        results = self.column('result').tobytes()
+        return {name: results.count(code) for name, code in RESULT_CODES.items()}
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def cards_of(record, count_offset, cards_offset):
+    """Card ids of one hand in a record, e.g. cards_of(record, PLAYER_COUNT, PLAYER_CARDS)."""
+    return record[cards_offset:cards_offset + min(record[count_offset], MAX_CARDS)]
@@ -0,0 +1,97 @@
+import math
+
+
+# This is the normal quantile for two-sided 95% confidence intervals
+Z_95 = 1.959963984540054
+
+# This is the return of one round per result, for one unit bet
+RESULT_RETURNS = {"win": 1.0, "lose": -1.0, "push": 0.0}
+
+
+class RunningStats:
+    """Streaming round statistics in constant memory. We created this class to avoid keeping per-round lists.
+
+    Win/lose/push counts and the mean and variance of the per-round return are updated online with
+    Welford's method, so rates and 95% confidence intervals are always current. Two instances
+    (for example from different processes) combine exactly with merge(). An instance can be used
+    directly as a Game21 round listener.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+    def __call__(self, game):
+        self.add_round(game.result, game.round_net())
+
+    def add_round(self, result, net=None):
+        """Add one round by result name; `net` overrides the per-round return (default ±1 or 0)."""
+        if result == "win":
+            self.wins += 1
+        elif result == "lose":
+            self.losses += 1
+        else:
+            self.pushes += 1
+        value = RESULT_RETURNS[result] if net is None else net
+        # This is Welford's update of the running mean and squared deviations
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        """Fold another RunningStats into this one (Chan's parallel update) and return self."""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance of the per-round return."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def rate(self, result):
+        """Fraction of rounds with the given result ("win", "lose" or "push")."""
+        if self.count == 0:
+            return 0.0
+        counts = {"win": self.wins, "lose": self.losses, "push": self.pushes}
+        return counts[result] / self.count
+
+    def rate_interval(self, result):
+        """95% confidence interval (low, high) of a result rate, using the Wilson score interval."""
+        if self.count == 0:
+            return 0.0, 1.0
+        n = self.count
+        p = self.rate(result)
+        centre = (p + Z_95 * Z_95 / (2 * n)) / (1 + Z_95 * Z_95 / n)
+        half_width = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 * Z_95 / (4 * n * n)) / (1 + Z_95 * Z_95 / n)
+        return centre - half_width, centre + half_width
+
+    def mean_interval(self):
+        """95% confidence interval (low, high) of the mean per-round return."""
+        if self.count < 2:
+            return self.mean, self.mean
+        half_width = Z_95 * math.sqrt(self.variance / self.count)
+        return self.mean - half_width, self.mean + half_width
+
+    def to_dict(self):
+        """Plain-dict form, for sending between processes or saving."""
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.__dict__.update(data)
+        return stats
@@ -0,0 +1,93 @@
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from game_logic import Game21, RuleSet, mimic_dealer_policy, new_round_stats, merge_round_stats
+
+
+BACKENDS = ('engine', 'numpy')
+
+
+def split_rounds(n, workers):
+    """Split n rounds into `workers` near-equal parts, larger parts first."""
+    base, extra = divmod(n, workers)
+    return [base + (1 if i < extra else 0) for i in range(workers)]
+
+
+def _run_part(backend, rounds, seed_sequence, rules, penetration, policy):
+    """Play one worker's share of the rounds with its own RNG stream."""
+    if backend == 'numpy':
+        # Imported here so the engine backend does not pay for it in every worker
+        import vector_sim
+        return vector_sim.simulate(rounds, policy, rules, np.random.default_rng(seed_sequence))
+    # This turns the worker's seed sequence into a seed for a private random.Random
+    seed = int.from_bytes(seed_sequence.generate_state(4).tobytes(), 'little')
+    game = Game21(penetration=penetration, rng=random.Random(seed), rules=rules)
+    return game.play_rounds(rounds, policy)
+
+
+def run_simulation(n, workers=None, seed=None, backend='engine', rules=None, penetration=0.75,
+                   policy=mimic_dealer_policy):
+    """Play n rounds split across a process pool and return the merged counters.
+
+    Every worker gets a child of one master SeedSequence, so the streams are independent, and the
+    partial results are merged in worker order. The same seed, worker count and settings therefore
+    give identical totals. The seed actually used is returned under 'seed' so runs without an
+    explicit seed can be reproduced too. `policy` must be a module-level function (picklable) and
+    `rules` a RuleSet (the default is single-deck S17 paying 3:2).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    rules = RuleSet() if rules is None else rules
+    if backend == 'numpy':
+        # This rejects unsupported rules here rather than in every worker process
+        import vector_sim
+        vector_sim.check_rules(rules)
+    workers = workers or os.cpu_count() or 1
+    master = np.random.SeedSequence(seed)
+    children = master.spawn(workers)
+    parts = split_rounds(n, workers)
+    args = [(backend, rounds, child, rules, penetration, policy)
+            for rounds, child in zip(parts, children)]
+
+    if workers == 1:
+        results = [_run_part(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order, which keeps the merge deterministic
+            results = list(pool.map(_run_part, *zip(*args)))
+
+    stats = new_round_stats()
+    for result in results:
+        merge_round_stats(stats, result)
+    stats['seed'] = master.entropy
+    return stats
+
+
+def main():
+    """Command-line entry point for multi-core simulation runs."""
+    parser = argparse.ArgumentParser(description="Run a multi-core 21 simulation")
+    parser.add_argument("rounds", type=int)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--backend", choices=BACKENDS, default='engine')
+    parser.add_argument("--decks", type=int, default=1)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--payout", type=float, default=1.5, help="blackjack payout, e.g. 1.2 for 6:5")
+    parser.add_argument("--double", choices=RuleSet.DOUBLE_RULES, default='none')
+    parser.add_argument("--surrender", action="store_true")
+    args = parser.parse_args()
+    if args.backend == 'numpy' and (args.double != 'none' or args.surrender):
+        parser.error("--double and --surrender need the engine backend")
+
+    rules = RuleSet(args.h17, args.decks, args.payout, args.double, args.surrender)
+    stats = run_simulation(args.rounds, args.workers, args.seed, args.backend, rules)
+    for key, value in stats.items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
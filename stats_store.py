@@ -0,0 +1,154 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+from tracing import tracer
+
+
+# This is where round results are kept between sessions
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".za21", "stats.db")
+
+# This bounds how many rounds are committed together, and how long a round may wait for its batch
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    day TEXT NOT NULL,
+    result TEXT NOT NULL,
+    player_total INTEGER NOT NULL,
+    dealer_total INTEGER NOT NULL,
+    player_cards INTEGER NOT NULL,
+    dealer_cards INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_by_session ON rounds (session_id, result);
+CREATE INDEX IF NOT EXISTS rounds_by_day ON rounds (day, result);
+"""
+
+INSERT_ROUND = """
+INSERT INTO rounds (session_id, played_at, day, result, player_total, dealer_total, player_cards, dealer_cards)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SUMMARY_COLUMNS = """
+COUNT(*) AS rounds,
+SUM(result = 'win') AS wins,
+SUM(result = 'lose') AS losses,
+SUM(result = 'push') AS pushes
+"""
+
+# This marks the end of the queue for the writer thread
+_STOP = object()
+
+
+class StatsStore:
+    """Saves round results to SQLite from a background writer. We created this class so the UI never waits on disk.
+
+    The store is a Game21 round listener: attach it with game.round_listeners.append(store). Each
+    finished round is queued in memory and a writer thread commits the queue in batches to a
+    database in WAL mode, so summaries can be read while rounds are being written.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, session_id=None):
+        self.path = path
+        self.session_id = session_id or uuid.uuid4().hex
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # This creates the schema once, before the writer thread takes the connection over
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        connection.commit()
+
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, args=(connection,),
+                                       name="StatsStoreWriter", daemon=True)
+        self.writer.start()
+
+    def __call__(self, game):
+        """Queue the finished round of a Game21. This never touches the disk."""
+        now = time.time()
+        self.queue.put((
+            self.session_id,
+            now,
+            time.strftime("%Y-%m-%d", time.localtime(now)),
+            game.result,
+            game.player_hand.calculate_value(),
+            game.dealer_hand.calculate_value(),
+            len(game.player_hand.cards),
+            game.dealer_hand.get_card_count(),
+        ))
+
+    def _write_loop(self, connection):
+        """Commit queued rounds in batches until close() is called."""
+        running = True
+        while running:
+            # This waits for the first round of the next batch
+            item = self.queue.get()
+            batch = []
+            done = 1
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            # This collects more rounds until the batch is full or the flush interval has passed
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    done += 1
+                except queue.Empty:
+                    break
+            if item is _STOP:
+                running = False
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(INSERT_ROUND, batch)
+                except sqlite3.Error as e:
+                    tracer.error("Could not save statistics: %s", e)
+            for _ in range(done):
+                self.queue.task_done()
+        connection.close()
+
+    def flush(self):
+        """Block until every queued round has been committed."""
+        self.queue.join()
+
+    def close(self):
+        """Commit the remaining rounds and stop the writer thread."""
+        if self.writer.is_alive():
+            self.queue.put(_STOP)
+            self.writer.join()
+
+    def _query(self, sql, parameters=()):
+        """Run a read query on a short-lived connection; WAL lets it run alongside the writer."""
+        connection = sqlite3.connect(self.path)
+        try:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, parameters)]
+        finally:
+            connection.close()
+
+    def session_summary(self, session_id=None):
+        """Round counts for one session (this one by default)."""
+        rows = self._query(f"SELECT {SUMMARY_COLUMNS} FROM rounds WHERE session_id = ?",
+                           (session_id or self.session_id,))
+        return {key: value or 0 for key, value in rows[0].items()}
+
+    def daily_summaries(self, since=None):
+        """Round counts per day, newest first, optionally from the date `since` ('YYYY-MM-DD') onwards."""
+        return self._query(f"SELECT day, {SUMMARY_COLUMNS} FROM rounds WHERE day >= ? "
+                           "GROUP BY day ORDER BY day DESC", (since or "",))
+
+    def lifetime_summary(self):
+        """Round counts over every saved session."""
+        rows = self._query(f"SELECT {SUMMARY_COLUMNS} FROM rounds")
+        return {key: value or 0 for key, value in rows[0].items()}
@@ -0,0 +1,166 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+from analytics import dealer_distribution, full_shoe_composition, stand_ev
+
+
+# This identifies a strategy table file and its layout version
+TABLE_MAGIC = b"BJSTRAT2"
+# This is bumped whenever generate_table() would produce different decisions, so older files are rebuilt
+GENERATOR_VERSION = 1
+# This is the file header: magic, generator version, number of decks, dealer hits soft 17
+TABLE_HEADER = struct.Struct("<8sHBB")
+# This is the table shape: player total 0-21, soft flag, dealer upcard value 0-11 (Ace = 11)
+TOTALS, SOFT_FLAGS, UPCARDS = 22, 2, 12
+TABLE_SIZE = TOTALS * SOFT_FLAGS * UPCARDS
+
+HIT = 1
+STAND = 0
+
+# This is where the shipped tables are kept, one file per rule variant (see main() to regenerate them)
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_tables")
+# This is where tables missing or outdated in TABLE_DIR are generated at run time
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".za21", "strategy_tables")
+
+# This caches the loaded (memory-mapped) tables per rule variant
+_loaded_tables = {}
+
+
+def table_index(total, soft, upcard):
+    """Position of (player total, soft flag, dealer upcard value) in a strategy table."""
+    return (total * SOFT_FLAGS + (1 if soft else 0)) * UPCARDS + upcard
+
+
+def _decisions_for_upcard(upcard, composition, hits_soft_17=False, num_decks=1):
+    """Best hit/stand decision for every player hand against one upcard."""
+    distribution = dealer_distribution(upcard, composition, hits_soft_17, num_decks)
+    remaining = sum(composition)
+    draw_odds = [(index + 1, count / remaining) for index, count in enumerate(composition)]
+    best = {}
+
+    def best_ev(hard, has_ace):
+        key = (hard, has_ace)
+        if key not in best:
+            total = hard + 10 if has_ace and hard <= 11 else hard
+            stand = stand_ev(total, distribution)
+            hit = 0.0
+            for value, probability in draw_odds:
+                next_hard = hard + value
+                hit += probability * (-1.0 if next_hard > 21 else best_ev(next_hard, has_ace or value == 1)[0])
+            best[key] = (max(stand, hit), hit > stand)
+        return best[key]
+
+    decisions = {}
+    for total in range(4, 22):
+        decisions[(total, False)] = best_ev(total, False)[1]
+    for total in range(12, 22):
+        decisions[(total, True)] = best_ev(total - 10, True)[1]
+    return decisions
+
+
+def generate_table(num_decks=1, hits_soft_17=False):
+    """Compute the basic-strategy hit/stand table for a shoe of `num_decks` decks.
+
+    Decisions depend only on the player total, soft flag and dealer upcard (total-dependent basic
+    strategy), using the exact dealer distribution for a full shoe and the dealer rule (S17, or H17
+    with `hits_soft_17`).
+    Returns the table as bytes: HIT or STAND for every table_index().
+    """
+    composition = full_shoe_composition(num_decks)
+    table = bytearray(TABLE_SIZE)
+    for upcard in range(2, 12):
+        for (total, soft), hit in _decisions_for_upcard(upcard, composition, hits_soft_17, num_decks).items():
+            table[table_index(total, soft, upcard)] = HIT if hit else STAND
+    return bytes(table)
+
+
+def table_path(num_decks=1, hits_soft_17=False, directory=TABLE_DIR):
+    """File name of the table for a rule variant."""
+    dealer_rule = "h17" if hits_soft_17 else "s17"
+    return os.path.join(directory, f"basic_strategy_{num_decks}deck_{dealer_rule}.bin")
+
+
+def table_header(num_decks=1, hits_soft_17=False):
+    """The header a current table file for a rule variant starts with."""
+    return TABLE_HEADER.pack(TABLE_MAGIC, GENERATOR_VERSION, num_decks, hits_soft_17)
+
+
+def write_table(path, table, num_decks=1, hits_soft_17=False):
+    """Write a table file atomically, so concurrent loaders never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(table_header(num_decks, hits_soft_17) + table)
+    os.replace(temp_path, path)
+
+
+def _map_table(path, num_decks, hits_soft_17):
+    """Memory-map a table file; returns None if it is missing, damaged or from another generator or rule set."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # This covers a missing file, and mmap refusing an empty one
+        return None
+    if len(mapped) != TABLE_HEADER.size + TABLE_SIZE or \
+            mapped[:TABLE_HEADER.size] != table_header(num_decks, hits_soft_17):
+        mapped.close()
+        return None
+    return memoryview(mapped)[TABLE_HEADER.size:]
+
+
+def load_table(num_decks=1, hits_soft_17=False):
+    """Return the strategy table for a rule variant, memory-mapped read-only.
+
+    The shipped table in TABLE_DIR is used when its header matches GENERATOR_VERSION and the rule
+    variant. Otherwise the table is generated once into CACHE_DIR, and an outdated cached file is
+    replaced. Every process that loads a table maps the same file, so the operating system shares one
+    copy of the pages between them. If the cache cannot be written, the table is kept in memory.
+    """
+    variant = (num_decks, hits_soft_17)
+    if variant in _loaded_tables:
+        return _loaded_tables[variant]
+
+    for directory in (TABLE_DIR, CACHE_DIR):
+        table = _map_table(table_path(num_decks, hits_soft_17, directory), num_decks, hits_soft_17)
+        if table is not None:
+            _loaded_tables[variant] = table
+            return table
+
+    generated = generate_table(num_decks, hits_soft_17)
+    path = table_path(num_decks, hits_soft_17, CACHE_DIR)
+    try:
+        write_table(path, generated, num_decks, hits_soft_17)
+        table = _map_table(path, num_decks, hits_soft_17)
+    except OSError:
+        table = None
+    if table is None:
+        table = memoryview(generated)
+    _loaded_tables[variant] = table
+    return table
+
+
+def lookup(table, total, soft, upcard):
+    """Return "hit" or "stand" for a hand from a loaded table."""
+    return "hit" if table[table_index(total, soft, upcard)] == HIT else "stand"
+
+
+def main():
+    """Command-line entry point: regenerate the table for every rule variant, ahead of time."""
+    parser = argparse.ArgumentParser(description="Generate the basic-strategy tables")
+    parser.add_argument("--output", default=TABLE_DIR, help="directory to write the tables to")
+    args = parser.parse_args()
+
+    for num_decks in range(1, 9):
+        for hits_soft_17 in (False, True):
+            path = table_path(num_decks, hits_soft_17, args.output)
+            write_table(path, generate_table(num_decks, hits_soft_17), num_decks, hits_soft_17)
+            print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
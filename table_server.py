@@ -0,0 +1,221 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from game_logic import Game21, RuleSet
+
+
+# This bounds one request line; longer lines are rejected instead of buffered without limit
+MAX_LINE = 4096
+# This closes connections and drops tables that have been silent for this many seconds
+IDLE_TIMEOUT = 300.0
+MAX_TABLES = 10000
+
+OPS = ('open', 'deal', 'hit', 'stand', 'state', 'close')
+
+
+class Table:
+    """One hosted Game21 table. We kept this class to the game plus the bookkeeping the server needs."""
+
+    __slots__ = ('id', 'game', 'last_used', 'owner')
+
+    def __init__(self, table_id, game, owner):
+        self.id = table_id
+        self.game = game
+        self.last_used = time.monotonic()
+        self.owner = owner
+
+    def state(self):
+        """What the player may see of the table, as a JSON-ready dict."""
+        game = self.game
+        dealer_hand = game.dealer_hand
+        hidden = dealer_hand.face_down_card is not None
+        return {
+            'table': self.id,
+            'state': game.game_state,
+            'player': [card.display_text for card in game.player_hand.cards],
+            'player_total': game.player_total() if game.player_hand.cards else None,
+            'dealer': [card.display_text for card in dealer_hand.cards] + (['??'] if hidden else []),
+            'dealer_total': None if hidden or not dealer_hand.cards else game.dealer_total(),
+            'result': game.result,
+        }
+
+
+class TableServer:
+    """Hosts many Game21 tables on one asyncio event loop. We created this class for bots and external front-ends.
+
+    Clients send one JSON object per line, e.g. {"op": "deal", "table": 3}, and get one JSON object
+    per line back. A connection can open any number of tables; they are closed with the connection,
+    on "close", or after IDLE_TIMEOUT seconds without a request. Responses are awaited with drain(),
+    so a client that stops reading stops being served instead of growing the server's buffers.
+    """
+
+    def __init__(self, rules=None, idle_timeout=IDLE_TIMEOUT, max_tables=MAX_TABLES, rng=None):
+        self.rules = rules if rules is not None else RuleSet()
+        self.idle_timeout = idle_timeout
+        self.max_tables = max_tables
+        # This shares one random generator between tables; every shoe still gets its own seed
+        self.rng = rng if rng is not None else random.Random()
+        self.tables = {}
+        self.table_ids = itertools.count(1)
+        # This maps each connection's handler task to its writer, so close() can end them cleanly
+        self.connections = {}
+        self.server = None
+        self.reaper = None
+
+    async def start(self, host="127.0.0.1", port=8021, path=None):
+        """Start listening on TCP, or on a Unix socket when `path` is given."""
+        if path:
+            self.server = await asyncio.start_unix_server(self.handle_client, path, limit=MAX_LINE)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE)
+        self.reaper = asyncio.create_task(self.reap_idle_tables())
+        return self.server
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections and drop every table."""
+        if self.reaper:
+            self.reaper.cancel()
+        if self.server:
+            self.server.close()
+        # This closes the open connections; their handlers see end-of-stream and finish normally
+        for writer in list(self.connections.values()):
+            writer.close()
+        if self.connections:
+            await asyncio.wait(list(self.connections))
+        if self.server:
+            await self.server.wait_closed()
+        self.tables.clear()
+
+    async def reap_idle_tables(self):
+        """Drop tables that have not been used within the idle timeout."""
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            cutoff = time.monotonic() - self.idle_timeout
+            for table_id in [t.id for t in self.tables.values() if t.last_used < cutoff]:
+                del self.tables[table_id]
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection until it closes, goes idle or sends a line that is too long."""
+        owned = set()
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    # This is a line longer than MAX_LINE; the stream cannot be resynchronised
+                    writer.write(b'{"error": "request line too long"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write(json.dumps(self.handle_request(line, owned)).encode() + b"\n")
+                # This waits while the client is not reading its responses (backpressure)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.connections[task]
+            for table_id in owned:
+                self.tables.pop(table_id, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def handle_request(self, line, owned):
+        """Run one request line and return the response dict. Errors are reported, never raised."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'error': "invalid JSON"}
+        if not isinstance(request, dict):
+            return {'error': "request must be a JSON object"}
+        try:
+            response = self.run_op(request, owned)
+        except (TypeError, ValueError) as e:
+            response = {'error': str(e)}
+        # This echoes the client's request id so pipelined responses can be matched up
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def run_op(self, request, owned):
+        op = request.get('op')
+        if op not in OPS:
+            raise ValueError(f"op must be one of {OPS}")
+
+        if op == 'open':
+            if len(self.tables) >= self.max_tables:
+                raise ValueError("server is full")
+            table = Table(next(self.table_ids), Game21(rng=self.rng, rules=self.rules), owned)
+            self.tables[table.id] = table
+            owned.add(table.id)
+            return table.state()
+
+        table = self.tables.get(request.get('table'))
+        if table is None or table.owner is not owned:
+            raise ValueError("unknown table")
+        table.last_used = time.monotonic()
+        game = table.game
+
+        if op == 'close':
+            del self.tables[table.id]
+            owned.discard(table.id)
+            return {'table': table.id, 'closed': True}
+        if op == 'deal':
+            if game.game_state == "player_turn":
+                raise ValueError("round in progress")
+            game.new_round()
+            game.deal_initial_cards()
+        elif op == 'hit':
+            if game.game_state != "player_turn":
+                raise ValueError("not the player's turn")
+            game.player_hit()
+        elif op == 'stand':
+            if game.game_state != "player_turn":
+                raise ValueError("not the player's turn")
+            game.player_stand()
+            game.play_dealer_turn()
+        return table.state()
+
+
+def main():
+    """Command-line entry point for the headless table server."""
+    parser = argparse.ArgumentParser(description="Host 21 tables over newline-delimited JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8021)
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    parser.add_argument("--max-tables", type=int, default=MAX_TABLES)
+    parser.add_argument("--decks", type=int, default=1)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    args = parser.parse_args()
+
+    async def run():
+        server = TableServer(RuleSet(args.h17, args.decks), args.idle_timeout, args.max_tables)
+        await server.start(args.host, args.port, args.unix)
+        print(f"Table server listening on {args.unix or f'{args.host}:{args.port}'}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import itertools
+import threading
+from collections import Counter
+
+import pytest
+
+from analytics import (DEALER_OUTCOMES, FULL_DECK_COMPOSITION, EVCancelled, clear_cache, composition_key,
+                       dealer_distribution, full_shoe_composition, hit_stand_ev)
+
+
+def dealer_outcome(upcard, draws, hits_soft_17):
+    """Play a dealer hand the way Game21 does, drawing from `draws` in order (values 1-10)."""
+    hard, aces = upcard, upcard == 1
+    for value in draws:
+        total = hard + 10 if aces and hard <= 11 else hard
+        if total > 17 or (total == 17 and not (hits_soft_17 and total != hard)):
+            break
+        hard += value
+        aces = aces or value == 1
+    total = hard + 10 if aces and hard <= 11 else hard
+    return 'bust' if total > 21 else total
+
+
+def brute_force_distribution(upcard, cards, hits_soft_17):
+    """Dealer outcome frequencies over every order of a small list of card values."""
+    outcomes = Counter(dealer_outcome(upcard, order, hits_soft_17) for order in itertools.permutations(cards))
+    count = sum(outcomes.values())
+    return {outcome: outcomes[outcome] / count for outcome in DEALER_OUTCOMES}
+
+
+@pytest.mark.parametrize("hits_soft_17", [False, True])
+@pytest.mark.parametrize("upcard, cards", [(6, [1, 2, 5, 6, 10, 10, 10]), (1, [1, 6, 3, 4, 10, 9, 2])])
+def test_dealer_distribution_matches_brute_force(upcard, cards, hits_soft_17):
+    composition = [0] * 10
+    for value in cards:
+        composition[value - 1] += 1
+    exact = dealer_distribution(11 if upcard == 1 else upcard, composition, hits_soft_17)
+    assert exact == pytest.approx(brute_force_distribution(upcard, cards, hits_soft_17))
+
+
+def test_dealer_distribution_sums_to_one():
+    distribution = dealer_distribution(10, FULL_DECK_COMPOSITION)
+    assert sum(distribution.values()) == pytest.approx(1.0)
+
+
+def test_soft_17_depends_on_the_dealer_rule():
+    only_sixes = (0, 0, 0, 0, 0, 4, 0, 0, 0, 0)
+    assert dealer_distribution(11, only_sixes)[17] == 1.0
+    assert dealer_distribution(11, only_sixes, hits_soft_17=True)[19] == 1.0
+
+
+def test_an_exhausted_composition_refills_the_whole_shoe():
+    empty = (0,) * 10
+    assert dealer_distribution(10, empty, num_decks=6) == dealer_distribution(10, full_shoe_composition(6))
+    assert dealer_distribution(10, empty) == dealer_distribution(10, FULL_DECK_COMPOSITION)
+
+
+def test_composition_key_merges_ten_valued_ranks():
+    assert composition_key((4,) * 13) == FULL_DECK_COMPOSITION
+    assert composition_key(FULL_DECK_COMPOSITION) == FULL_DECK_COMPOSITION
+
+
+def test_hit_stand_ev_against_a_known_shoe():
+    only_tens = (0,) * 9 + (20,)
+    # Standing on 20 against a 10 upcard and a ten in the hole always pushes; hitting always busts
+    assert hit_stand_ev(20, False, 10, only_tens) == (-1.0, 0.0)
+    # Hitting 11 makes 21, which beats the dealer's 20
+    hit, stand = hit_stand_ev(11, False, 10, only_tens)
+    assert hit == 1.0 and stand == -1.0
+
+
+def test_hit_stand_ev_can_be_cancelled():
+    clear_cache()
+    cancelled = threading.Event()
+    cancelled.set()
+    with pytest.raises(EVCancelled):
+        hit_stand_ev(12, False, 10, full_shoe_composition(6), cancelled=cancelled)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import bankroll
+import vector_sim
+from bankroll import NEVER, simulate_bankroll
+from game_logic import RuleSet
+
+
+def test_trajectory_is_recorded_on_the_grid_and_ends_with_the_final_bankroll():
+    result = simulate_bankroll(50, 250, paths=300, record_every=100, rng=np.random.default_rng(1))
+    assert result.trajectory.shape == (300, 4)
+    assert (result.trajectory[:, 0] == 50).all()
+    assert (result.trajectory[:, -1] == result.final).all()
+
+
+def test_ruined_paths_stay_frozen(monkeypatch):
+    # This forces many small batches, so ruin and doubling are carried across batch boundaries
+    monkeypatch.setattr(bankroll, "HANDS_PER_BATCH", 4096)
+    result = simulate_bankroll(5, 400, paths=2000, record_every=1, rng=np.random.default_rng(2))
+    assert 0 < result.risk_of_ruin() < 1
+    assert (result.final[result.ruined] < 1).all()
+    assert (result.final[~result.ruined] >= 1).all()
+    for path in np.flatnonzero(result.ruined)[:50]:
+        ruin = result.ruin_round[path]
+        assert (result.trajectory[path, ruin:] == result.final[path]).all()
+        assert (result.trajectory[path, :ruin] >= 1).all()
+    for path in np.flatnonzero(result.double_round != NEVER)[:50]:
+        doubled = result.double_round[path]
+        assert result.trajectory[path, doubled] >= 10
+        assert (result.trajectory[path, :doubled] < 10).all()
+    assert (result.max_drawdown >= 5 - result.final).all()
+
+
+def test_mean_final_matches_the_expected_return_per_round():
+    rules = RuleSet(num_decks=6)
+    result = simulate_bankroll(1000, 200, paths=5000, rules=rules, rng=np.random.default_rng(3))
+    assert not result.ruined.any()
+    edge = vector_sim.simulate(1000000, rules=rules, rng=np.random.default_rng(4))['net'] / 1000000
+    # This allows about five standard errors of the two estimates
+    assert result.final.mean() - 1000 == pytest.approx(200 * edge, abs=1.5)
+
+
+def test_a_bet_policy_never_stakes_more_than_the_bankroll():
+    result = simulate_bankroll(10, 300, paths=500, bet=lambda balance: balance * 0.5, min_bet=0.01,
+                               rng=np.random.default_rng(5))
+    assert (result.final > 0).all()
+    assert result.summary()['paths'] == 500
+
+
+def test_rules_the_vector_backend_cannot_play_are_rejected():
+    with pytest.raises(ValueError):
+        simulate_bankroll(10, 10, paths=10, rules=RuleSet(surrender=True))
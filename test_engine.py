@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from game_logic import DOUBLE, MAX_SEATS, SURRENDER, Game21, RuleSet, compile_round_engine, mimic_dealer_policy
+
+
+def play_step_by_step(game, n):
+    """Play n rounds through the interactive methods, hitting below 17 like mimic_dealer_policy."""
+    for _ in range(n):
+        game.new_round()
+        game.deal_initial_cards()
+        while game.game_state == "player_turn" and game.player_total() < 17:
+            game.player_hit()
+        if game.game_state == "player_turn":
+            game.player_stand()
+            game.play_dealer_turn()
+
+
+@pytest.mark.parametrize("rules", [RuleSet(), RuleSet(dealer_hits_soft_17=True), RuleSet(num_decks=6)])
+def test_batch_engine_matches_step_by_step(rules):
+    batch = Game21(rng=random.Random(11), rules=rules)
+    stats = batch.play_rounds(5000, mimic_dealer_policy)
+
+    interactive = Game21(rng=random.Random(11), rules=rules)
+    play_step_by_step(interactive, 5000)
+
+    assert stats['rounds'] == interactive.rounds_played
+    assert stats['wins'] == interactive.player_wins
+    assert stats['losses'] == interactive.dealer_wins
+    assert stats['pushes'] == interactive.rounds_played - interactive.player_wins - interactive.dealer_wins
+    # This checks both games finished on the same card of the same shoe
+    assert (batch.deck.seed, batch.deck.cursor) == (interactive.deck.seed, interactive.deck.cursor)
+    assert batch.deck.rank_counts == interactive.deck.rank_counts
+
+
+def double_and_surrender_policy(total, soft, upcard):
+    """Double on 11, surrender hard 16 against a ten, otherwise play like the dealer."""
+    if total == 11:
+        return DOUBLE
+    if total == 16 and not soft and upcard == 10:
+        return SURRENDER
+    return total < 17
+
+
+def test_engines_are_compiled_once_per_rule_set():
+    assert compile_round_engine(RuleSet(num_decks=2)) is compile_round_engine(RuleSet(num_decks=2))
+    assert compile_round_engine(RuleSet(num_decks=2)) is not compile_round_engine(RuleSet(num_decks=3))
+
+
+def test_six_to_five_only_changes_the_blackjack_payout():
+    three_to_two = Game21(rng=random.Random(7), rules=RuleSet()).play_rounds(5000)
+    six_to_five = Game21(rng=random.Random(7), rules=RuleSet(blackjack_payout=1.2)).play_rounds(5000)
+    for key in ('wins', 'losses', 'pushes', 'blackjacks', 'dealer_totals'):
+        assert six_to_five[key] == three_to_two[key]
+    paid_naturals = (three_to_two['net'] - six_to_five['net']) / 0.3
+    assert paid_naturals == pytest.approx(round(paid_naturals))
+    assert 0 < round(paid_naturals) <= three_to_two['blackjacks']
+
+
+@pytest.mark.parametrize("double_on, surrender", [('none', False), ('any', True), ('10-11', False)])
+def test_doubling_and_surrender_follow_the_rules(double_on, surrender):
+    rules = RuleSet(double_on=double_on, surrender=surrender)
+    stats = Game21(rng=random.Random(12), rules=rules).play_rounds(5000, double_and_surrender_policy)
+    assert (stats['doubles'] > 0) == (double_on != 'none')
+    assert (stats['surrenders'] > 0) == surrender
+    assert stats['wagered'] == stats['rounds'] + stats['doubles']
+    assert stats['wins'] + stats['losses'] + stats['pushes'] == stats['rounds']
+
+
+def test_one_seat_table_matches_play_rounds():
+    rules = RuleSet(dealer_hits_soft_17=True, num_decks=2, double_on='any', surrender=True)
+    single = Game21(rng=random.Random(3), rules=rules).play_rounds(3000)
+    table = Game21(rng=random.Random(3), rules=rules).play_table_rounds(3000, seats=1)
+    for key in ('wins', 'losses', 'pushes', 'blackjacks', 'player_busts', 'dealer_busts', 'net', 'wagered'):
+        assert table[key][0] == single[key]
+    assert table['dealer_totals'] == single['dealer_totals']
+
+
+def test_every_seat_finishes_every_round():
+    game = Game21(rng=random.Random(4), rules=RuleSet(num_decks=6))
+    stats = game.play_table_rounds(2000, seats=MAX_SEATS)
+    assert stats['rounds'] == 2000
+    for seat in range(MAX_SEATS):
+        assert stats['wins'][seat] + stats['losses'][seat] + stats['pushes'][seat] == 2000
+    with pytest.raises(ValueError):
+        game.play_table_rounds(10, seats=MAX_SEATS + 1)
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from load_harness import SUB_BUCKET_BITS, LatencyHistogram
+
+
+def test_small_values_have_their_own_bucket():
+    for value in range(1 << SUB_BUCKET_BITS):
+        assert LatencyHistogram.bucket_value(LatencyHistogram.bucket_index(value)) == value
+
+
+def test_buckets_are_ordered_and_within_one_percent():
+    rng = random.Random(1)
+    values = sorted(rng.randrange(1, 1 << 47) >> rng.randrange(40) for _ in range(20000))
+    indexes = [LatencyHistogram.bucket_index(value) for value in values]
+    assert indexes == sorted(indexes)
+    for value, index in zip(values, indexes):
+        assert abs(LatencyHistogram.bucket_value(index) - value) <= value * 0.01
+
+
+def test_percentiles_match_the_sorted_values():
+    rng = random.Random(2)
+    values = [int(rng.lognormvariate(10, 1.5)) for _ in range(10000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for percent in (50, 90, 99, 99.9):
+        exact = values[max(1, int(len(values) * percent / 100 + 0.5)) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.01)
+    assert histogram.max == values[-1]
+    assert histogram.percentile(100) <= histogram.max
+
+
+def test_merge_matches_recording_everything_in_one():
+    rng = random.Random(3)
+    values = [rng.randrange(1, 10 ** 9) for _ in range(5000)]
+    whole, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for index, value in enumerate(values):
+        whole.record(value)
+        (first if index % 3 else second).record(value)
+    merged = first.merge(second)
+    assert (merged.counts, merged.count, merged.max) == (whole.counts, whole.count, whole.max)
+
+
+def test_values_past_the_range_are_clamped():
+    histogram = LatencyHistogram()
+    histogram.record(1 << 60)
+    assert histogram.max == 1 << 60
+    assert histogram.percentile(50) <= histogram.max
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from game_logic import Game21, RuleSet
+from replay import (HEADER, RESULT_CODES, ROUND, Replayer, RoundRecorder, iter_records, read_header,
+                    verify_session)
+
+
+def record_session(path, rules, rounds, penetration=0.75, seed=5):
+    """Record `rounds` rounds with random hits and stands; returns the results and shoe states."""
+    game = Game21(penetration=penetration, rng=random.Random(seed), rules=rules)
+    moves = random.Random(seed + 1)
+    recorder = RoundRecorder(path, rules).attach(game)
+    results = []
+    shoe_states = []
+    for _ in range(rounds):
+        game.new_round()
+        game.deal_initial_cards()
+        while game.game_state == "player_turn":
+            if game.player_total() < 12 or moves.random() < 0.4:
+                game.player_hit()
+            else:
+                game.player_stand()
+                game.play_dealer_turn()
+        results.append(game.result)
+        shoe_states.append((game.deck.seed, game.deck.cursor, game.deck.rank_counts))
+    recorder.close()
+    return results, shoe_states
+
+
+def test_replay_round_trip(tmp_path):
+    path = tmp_path / "session.bjr"
+    rules = RuleSet(dealer_hits_soft_17=True, num_decks=2)
+    results, shoe_states = record_session(path, rules, 300)
+
+    assert read_header(path) == rules
+    assert verify_session(path) == (300, [])
+
+    # This replays the rounds backwards, so every round jumps within or between shoes
+    replayer = Replayer(read_header(path))
+    records = list(iter_records(path))
+    for index in reversed(range(len(records))):
+        replayed = replayer.replay(records[index])
+        assert replayed.result == results[index]
+        assert (replayed.deck.seed, replayed.deck.cursor, replayed.deck.rank_counts) == shoe_states[index]
+
+
+@pytest.mark.parametrize("rules", [RuleSet(), RuleSet(dealer_hits_soft_17=True, num_decks=6)])
+def test_fast_verify_agrees_with_replay(tmp_path, rules):
+    path = tmp_path / "session.bjr"
+    # A shoe dealt to the end makes some rounds run out mid-hand and reshuffle
+    record_session(path, rules, 3000, penetration=1.0)
+
+    replayer = Replayer(rules)
+    fast = Replayer(rules)
+    for record in iter_records(path):
+        seed, cursor, actions, result = ROUND.unpack(record)
+        assert fast.result_code(seed, cursor, actions) == RESULT_CODES[replayer.replay(record).result] == result
+
+
+def test_verify_session_reports_tampered_rounds(tmp_path):
+    path = tmp_path / "session.bjr"
+    record_session(path, RuleSet(), 50)
+    with open(path, "r+b") as f:
+        data = bytearray(f.read())
+        # This flips the recorded result of round 7
+        offset = HEADER.size + 8 * ROUND.size - 1
+        data[offset] = (data[offset] + 1) % 3
+        f.seek(0)
+        f.write(data)
+    assert verify_session(path) == (50, [7])
+
+
+def test_a_session_file_keeps_its_rules(tmp_path):
+    path = tmp_path / "session.bjr"
+    RoundRecorder(path, RuleSet(num_decks=2)).close()
+    with pytest.raises(ValueError):
+        RoundRecorder(path, RuleSet(num_decks=6))
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from game_logic import Game21
+from round_journal import (DEALER_CARDS, DEALER_COUNT, PLAYER_CARDS, PLAYER_COUNT, RESULT, JournalReader,
+                           RoundJournal, cards_of)
+from replay import RESULT_CODES
+
+
+def test_journal_round_trip(tmp_path):
+    path = tmp_path / "rounds.bjj"
+    game = Game21(rng=random.Random(9))
+    journal = RoundJournal(path)
+    game.round_listeners.append(journal)
+    rounds = []
+    for _ in range(200):
+        game.new_round()
+        game.deal_initial_cards()
+        while game.game_state == "player_turn" and game.player_total() < 15:
+            game.player_hit()
+        if game.game_state == "player_turn":
+            game.player_stand()
+            game.play_dealer_turn()
+        rounds.append(([card.id for card in game.player_hand.cards], [card.id for card in game.dealer_hand.cards],
+                       game.result))
+    journal.close()
+
+    with JournalReader(path) as reader:
+        assert len(reader) == 200
+        for record, (player, dealer, result) in zip(reader, rounds):
+            assert list(cards_of(record, PLAYER_COUNT, PLAYER_CARDS)) == player
+            assert list(cards_of(record, DEALER_COUNT, DEALER_CARDS)) == dealer
+            assert record[RESULT] == RESULT_CODES[result]
+        assert reader[-1][RESULT] == RESULT_CODES[rounds[-1][2]]
+        with pytest.raises(IndexError):
+            reader[200]
+        assert reader.result_counts() == {name: sum(result == name for _, _, result in rounds)
+                                          for name in RESULT_CODES}
+        assert reader.column('player_count').tolist() == [len(player) for player, _, _ in rounds]
+        # This drops the last record view, since the map cannot close while a view is alive
+        del record
+
+
+def test_a_partly_written_record_is_ignored(tmp_path):
+    path = tmp_path / "rounds.bjj"
+    RoundJournal(path).close()
+    with open(path, "ab") as f:
+        f.write(b"\x02\x01")
+    with JournalReader(path) as reader:
+        assert len(reader) == 0
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        JournalReader(path)
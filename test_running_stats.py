@@ -0,0 +1,60 @@
+import random
+import statistics
+
+import pytest
+
+from game_logic import Game21
+from running_stats import RESULT_RETURNS, RunningStats
+
+
+def test_running_stats_merge_matches_one_pass():
+    rng = random.Random(8)
+    results = [rng.choice(("win", "lose", "push")) for _ in range(1001)]
+    nets = [RESULT_RETURNS[result] * rng.choice((1, 1, 2, 1.5)) for result in results]
+
+    whole = RunningStats()
+    for result, net in zip(results, nets):
+        whole.add_round(result, net)
+
+    # This feeds uneven parts, including an empty one, and merges them in order
+    parts = [RunningStats() for _ in range(4)]
+    for part, (start, stop) in zip(parts, ((0, 0), (0, 10), (10, 600), (600, 1001))):
+        for result, net in zip(results[start:stop], nets[start:stop]):
+            part.add_round(result, net)
+    merged = RunningStats()
+    for part in parts:
+        merged.merge(part)
+
+    assert (merged.count, merged.wins, merged.losses, merged.pushes) == \
+        (whole.count, whole.wins, whole.losses, whole.pushes)
+    assert merged.mean == pytest.approx(statistics.fmean(nets))
+    assert merged.variance == pytest.approx(statistics.variance(nets))
+    assert whole.variance == pytest.approx(statistics.variance(nets))
+    assert RunningStats.from_dict(merged.to_dict()).mean == merged.mean
+
+
+def test_wilson_interval_contains_the_rate():
+    stats = RunningStats()
+    assert stats.rate_interval("win") == (0.0, 1.0)
+    for result in ["win"] * 30 + ["lose"] * 70:
+        stats.add_round(result)
+    low, high = stats.rate_interval("win")
+    assert low < 0.3 < high
+    assert low == pytest.approx(0.2189, abs=1e-4)
+    assert high == pytest.approx(0.3958, abs=1e-4)
+    low, high = stats.mean_interval()
+    assert stats.mean == pytest.approx(-0.4)
+    assert low < stats.mean < high
+
+
+def test_a_game_feeds_running_stats_as_a_round_listener():
+    game = Game21(rng=random.Random(4))
+    stats = RunningStats()
+    game.round_listeners.append(stats)
+    for _ in range(100):
+        game.new_round()
+        game.deal_initial_cards()
+        if game.game_state == "player_turn":
+            game.player_stand()
+            game.play_dealer_turn()
+    assert (stats.count, stats.wins, stats.losses) == (100, game.player_wins, game.dealer_wins)
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from game_logic import CARDS, HI_LO_TAGS, RANKS, Deck, Game21, Shoe
+
+
+def test_cut_card_sits_at_the_penetration():
+    shoe = Shoe(num_decks=6, penetration=0.75, rng=random.Random(1))
+    assert shoe.size == 312
+    assert shoe.cut_card == 234
+    for _ in range(233):
+        shoe.draw()
+    assert not shoe.needs_shuffle()
+    shoe.draw()
+    assert shoe.needs_shuffle()
+
+
+def test_rank_counts_follow_the_cards_dealt():
+    shoe = Shoe(num_decks=2, rng=random.Random(2))
+    assert shoe.rank_counts == (8,) * len(RANKS)
+    dealt = [shoe.draw() for _ in range(30)]
+    for index, rank in enumerate(RANKS):
+        assert shoe.rank_counts[index] == 8 - sum(card.rank == rank for card in dealt)
+    assert sum(shoe.rank_counts) == shoe.remaining() == len(shoe.cards) == 74
+
+
+def test_the_seed_rebuilds_the_order():
+    shoe = Shoe(num_decks=2, rng=random.Random(3))
+    order = shoe.cards
+    shoe.reset()
+    assert shoe.cards != order
+    shoe.reset(Shoe(num_decks=2, rng=random.Random(3)).seed)
+    assert shoe.cards == order
+
+
+def test_a_deck_holds_every_card_once():
+    deck = Deck(rng=random.Random(4))
+    assert sorted(card.id for card in deck.cards) == [card.id for card in CARDS]
+    assert deck.cut_card == deck.size == 52
+
+
+def test_drawing_past_the_end_reshuffles_reproducibly():
+    shoe = Shoe(num_decks=1, penetration=1.0, rng=random.Random(5))
+    seed = shoe.seed
+    for _ in range(52):
+        shoe.draw()
+    card = shoe.draw()
+    assert shoe.seed != seed
+    assert shoe.cursor == 1
+    assert sum(shoe.rank_counts) == 51
+
+    replay = Shoe(num_decks=1, penetration=1.0)
+    replay.reset(seed)
+    for _ in range(52):
+        replay.draw()
+    assert replay.draw() is card
+    assert replay.seed == shoe.seed
+
+
+def test_seek_recounts_the_undealt_cards():
+    shoe = Shoe(num_decks=2, rng=random.Random(6))
+    for _ in range(40):
+        shoe.draw()
+    counts = shoe.rank_counts
+    shoe.seek(0)
+    assert shoe.rank_counts == (8,) * len(RANKS)
+    shoe.seek(40)
+    assert shoe.rank_counts == counts
+    with pytest.raises(ValueError):
+        shoe.seek(shoe.size + 1)
+
+
+def test_shoe_size_is_checked():
+    with pytest.raises(ValueError):
+        Shoe(num_decks=9)
+    with pytest.raises(ValueError):
+        Shoe(penetration=0)
+
+
+def hi_lo(cards):
+    return sum(1 if 2 <= card.value <= 6 else (-1 if card.value >= 10 or card.is_ace else 0) for card in cards)
+
+
+def test_running_and_true_count_follow_the_cards_dealt():
+    shoe = Shoe(num_decks=6, rng=random.Random(7))
+    dealt = []
+    for _ in range(150):
+        dealt.append(shoe.draw())
+        assert shoe.running_count == hi_lo(dealt)
+    assert shoe.true_count == pytest.approx(hi_lo(dealt) / ((312 - 150) / 52))
+    # This checks the count survives moving the cursor, as the batch engine does
+    shoe.seek(40)
+    assert shoe.running_count == hi_lo(dealt[:40])
+    shoe.seek(shoe.size)
+    assert shoe.running_count == 0
+    assert shoe.true_count == 0.0
+
+
+def test_visible_count_leaves_out_the_hole_card():
+    game = Game21(rng=random.Random(8))
+    game.new_round()
+    game.deal_initial_cards()
+    hole_card = game.dealer_hand.face_down_card
+    assert hole_card is not None
+    running, true = game.visible_count()
+    assert running == hi_lo(game.player_hand.cards + game.dealer_hand.cards)
+    assert running == game.deck.running_count - HI_LO_TAGS[hole_card.id]
+    assert true == pytest.approx(running / (48 / 52))
+    game.player_stand()
+    game.play_dealer_turn()
+    assert game.visible_count()[0] == game.deck.running_count
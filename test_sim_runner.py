@@ -0,0 +1,35 @@
+import pytest
+
+from game_logic import RuleSet
+from sim_runner import run_simulation, split_rounds
+
+
+def test_split_rounds_covers_every_round():
+    assert split_rounds(10, 3) == [4, 3, 3]
+    assert sum(split_rounds(7, 8)) == 7
+
+
+@pytest.mark.parametrize("backend", ['engine', 'numpy'])
+def test_simulation_is_deterministic_for_a_seed(backend):
+    first = run_simulation(20000, workers=2, seed=1234, backend=backend)
+    second = run_simulation(20000, workers=2, seed=1234, backend=backend)
+    assert first == second
+    assert first['rounds'] == 20000
+    assert first['seed'] == 1234
+
+
+def test_a_run_without_a_seed_reports_the_seed_to_reproduce_it():
+    first = run_simulation(5000, workers=1)
+    assert run_simulation(5000, workers=1, seed=first['seed']) == first
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        run_simulation(100, workers=1, backend='gpu')
+
+
+def test_numpy_backend_rejects_doubling_and_surrender():
+    with pytest.raises(ValueError):
+        run_simulation(100, workers=1, backend='numpy', rules=RuleSet(double_on='any'))
+    with pytest.raises(ValueError):
+        run_simulation(100, workers=1, backend='numpy', rules=RuleSet(surrender=True))
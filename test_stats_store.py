@@ -0,0 +1,52 @@
+import random
+
+from game_logic import Game21
+from stats_store import StatsStore
+
+
+def play(game, rounds):
+    for _ in range(rounds):
+        game.new_round()
+        game.deal_initial_cards()
+        if game.game_state == "player_turn":
+            game.player_stand()
+            game.play_dealer_turn()
+
+
+def test_rounds_are_saved_per_session_day_and_lifetime(tmp_path):
+    path = str(tmp_path / "stats.db")
+    totals = {'rounds': 0, 'wins': 0, 'losses': 0, 'pushes': 0}
+    for seed in (1, 2):
+        game = Game21(rng=random.Random(seed))
+        store = StatsStore(path, session_id=f"session-{seed}")
+        game.round_listeners.append(store)
+        play(game, 120)
+        store.flush()
+
+        summary = store.session_summary()
+        assert summary == {'rounds': 120, 'wins': game.player_wins, 'losses': game.dealer_wins,
+                           'pushes': 120 - game.player_wins - game.dealer_wins}
+        for key in totals:
+            totals[key] += summary[key]
+        store.close()
+
+    store = StatsStore(path)
+    assert store.session_summary() == {'rounds': 0, 'wins': 0, 'losses': 0, 'pushes': 0}
+    assert store.session_summary("session-1")['rounds'] == 120
+    assert store.lifetime_summary() == totals
+    (today,) = store.daily_summaries()
+    assert {key: today[key] for key in totals} == totals
+    assert store.daily_summaries(since="9999-01-01") == []
+    store.close()
+
+
+def test_close_commits_the_queued_rounds(tmp_path):
+    path = str(tmp_path / "stats.db")
+    game = Game21(rng=random.Random(3))
+    store = StatsStore(path)
+    game.round_listeners.append(store)
+    play(game, 1000)
+    store.close()
+    reopened = StatsStore(path)
+    assert reopened.lifetime_summary()['rounds'] == 1000
+    reopened.close()
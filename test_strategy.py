@@ -0,0 +1,40 @@
+import pytest
+
+import strategy
+
+
+@pytest.mark.parametrize("num_decks", range(1, 9))
+@pytest.mark.parametrize("hits_soft_17", [False, True])
+def test_shipped_tables_are_current(num_decks, hits_soft_17):
+    path = strategy.table_path(num_decks, hits_soft_17)
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data == strategy.table_header(num_decks, hits_soft_17) + strategy.generate_table(num_decks, hits_soft_17)
+
+
+def test_basic_strategy_decisions():
+    table = strategy.load_table(6, False)
+    assert strategy.lookup(table, 11, False, 10) == "hit"
+    assert strategy.lookup(table, 12, False, 4) == "stand"
+    assert strategy.lookup(table, 16, False, 7) == "hit"
+    assert strategy.lookup(table, 17, False, 11) == "stand"
+    assert strategy.lookup(table, 18, True, 9) == "hit"
+    assert strategy.lookup(table, 18, True, 7) == "stand"
+
+
+def test_outdated_tables_are_rebuilt_in_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(strategy, "TABLE_DIR", str(tmp_path / "shipped"))
+    monkeypatch.setattr(strategy, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(strategy, "_loaded_tables", {})
+    # This is a table from an older generator, with every decision wrong
+    stale = strategy.table_path(2, True, strategy.CACHE_DIR)
+    header = strategy.TABLE_HEADER.pack(strategy.TABLE_MAGIC, strategy.GENERATOR_VERSION - 1, 2, True)
+    strategy.write_table(stale, bytes([strategy.HIT]) * strategy.TABLE_SIZE)
+    with open(stale, "r+b") as f:
+        f.write(header)
+
+    table = strategy.load_table(2, True)
+    assert bytes(table) == strategy.generate_table(2, True)
+    with open(stale, "rb") as f:
+        assert f.read(strategy.TABLE_HEADER.size) == strategy.table_header(2, True)
+    assert not (tmp_path / "shipped").exists()
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import random
+
+from table_server import MAX_LINE, TableServer
+
+
+def request(server, owned, **fields):
+    return server.handle_request(json.dumps(fields).encode(), owned)
+
+
+def test_a_round_through_requests():
+    server = TableServer(rng=random.Random(1))
+    owned = set()
+    table = request(server, owned, op='open')['table']
+    state = request(server, owned, op='deal', table=table, id=7)
+    assert state['id'] == 7
+    assert len(state['player']) == len(state['dealer']) == 2
+    while state['state'] == "player_turn":
+        state = request(server, owned, op='stand', table=table)
+    assert state['result'] in ("win", "lose", "push")
+    assert state['dealer_total'] is not None
+    assert 'error' in request(server, owned, op='hit', table=table)
+    assert request(server, owned, op='close', table=table) == {'table': table, 'closed': True}
+    assert server.tables == {}
+
+
+def test_bad_requests_are_reported():
+    server = TableServer(max_tables=1)
+    owned = set()
+    assert server.handle_request(b"{", owned) == {'error': "invalid JSON"}
+    assert 'error' in server.handle_request(b"[1]", owned)
+    assert 'error' in request(server, owned, op='fold')
+    table = request(server, owned, op='open')['table']
+    assert request(server, owned, op='open') == {'error': "server is full"}
+    # Another connection cannot play a table it did not open
+    assert request(server, set(), op='deal', table=table) == {'error': "unknown table"}
+
+
+def test_clients_over_tcp():
+    async def run():
+        server = TableServer(rng=random.Random(2))
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def client(rounds):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"op": "open", "id": 0}\n')
+            await writer.drain()
+            table = json.loads(await reader.readline())['table']
+            # This pipelines every request before reading a response
+            for number in range(1, rounds + 1):
+                writer.write(json.dumps({'op': 'deal', 'table': table, 'id': number}).encode() + b"\n")
+                writer.write(json.dumps({'op': 'stand', 'table': table}).encode() + b"\n")
+            await writer.drain()
+            ids = []
+            for _ in range(rounds):
+                ids.append(json.loads(await reader.readline())['id'])
+                await reader.readline()
+            writer.close()
+            await writer.wait_closed()
+            return ids
+
+        results = await asyncio.gather(*(client(20) for _ in range(25)))
+        assert all(ids == list(range(1, 21)) for ids in results)
+
+        # A line longer than MAX_LINE ends the connection with an error
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"x" * (MAX_LINE + 10) + b"\n")
+        await writer.drain()
+        assert 'error' in json.loads(await reader.readline())
+        assert await reader.readline() == b""
+        writer.close()
+
+        # This lets the handlers of the closed connections finish
+        for _ in range(100):
+            if not server.tables:
+                break
+            await asyncio.sleep(0.01)
+        assert server.tables == {}
+        await server.close()
+
+    asyncio.run(run())
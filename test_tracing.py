@@ -0,0 +1,74 @@
+import io
+import sys
+import threading
+
+from tracing import DEBUG, ERROR, INFO, WARNING, Tracer
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError("a dropped event was formatted")
+
+
+def test_events_below_the_level_are_dropped_unformatted():
+    tracer = Tracer(level=INFO, stream=io.StringIO())
+    tracer.debug("value %s", Unformattable(), action="skip")
+    with tracer.span("span %s", Unformattable()):
+        pass
+    assert not tracer.enabled(DEBUG) and tracer.enabled(INFO)
+    assert len(tracer.events) == 0
+
+
+def test_events_keep_their_fields():
+    tracer = Tracer(level=DEBUG, stream=io.StringIO())
+    tracer.info("Dealt %d cards", 4, action="deal", round_id=3)
+    with tracer.span("Stand", action="stand", round_id=3):
+        pass
+    dealt, stand = tracer.events
+    assert dealt.text == "Dealt 4 cards"
+    assert (dealt.action, dealt.round_id, dealt.duration) == ("deal", 3, None)
+    assert "action=deal round=3" in dealt.format()
+    assert stand.level == DEBUG and stand.duration >= 0
+    assert "duration_ms=" in stand.format()
+
+
+def test_the_ring_buffer_keeps_the_newest_events():
+    tracer = Tracer(level=DEBUG, capacity=10, stream=io.StringIO())
+    for number in range(25):
+        tracer.debug("event %d", number)
+    assert [event.args[0] for event in tracer.events] == list(range(15, 25))
+    stream = io.StringIO()
+    tracer.dump(stream)
+    assert stream.getvalue().count("\n") == 10
+
+
+def test_warnings_are_echoed():
+    stream = io.StringIO()
+    tracer = Tracer(level=INFO, echo_level=WARNING, stream=stream)
+    tracer.info("quiet")
+    tracer.warning("loud %s", "warning")
+    tracer.error("louder")
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert "WARNING loud warning" in lines[0] and "ERROR" in lines[1]
+
+
+def test_crash_handler_dumps_the_buffer(monkeypatch):
+    tracer = Tracer(level=DEBUG, echo_level=ERROR + 1)
+    seen = []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: seen.append(exc_info[0]))
+    monkeypatch.setattr(threading, "excepthook", lambda args: seen.append(args.exc_type))
+    stderr = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stderr)
+    tracer.install_crash_handler()
+    tracer.debug("before the crash")
+
+    sys.excepthook(KeyError, KeyError("card"), None)
+    thread = threading.Thread(target=lambda: 1 / 0, name="worker")
+    thread.start()
+    thread.join()
+
+    assert seen == [KeyError, ZeroDivisionError]
+    output = stderr.getvalue()
+    assert "before the crash" in output
+    assert "Uncaught KeyError" in output and "Uncaught ZeroDivisionError in thread worker" in output
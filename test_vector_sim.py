@@ -0,0 +1,28 @@
+import random
+
+import numpy as np
+import pytest
+
+import vector_sim
+from game_logic import Game21, RuleSet
+
+
+@pytest.mark.parametrize("rules", [RuleSet(), RuleSet(dealer_hits_soft_17=True, num_decks=6)])
+def test_vector_sim_agrees_statistically_with_game21(rules):
+    n = 100000
+    engine = Game21(rng=random.Random(21), rules=rules).play_rounds(n)
+    vectorized = vector_sim.simulate(n, rules=rules, rng=np.random.default_rng(21))
+
+    assert vectorized['rounds'] == n
+    # This allows four standard errors between the two rates; the cut card shifts them far less
+    for key in ('wins', 'losses', 'pushes', 'blackjacks', 'player_busts', 'dealer_busts'):
+        engine_rate = engine[key] / n
+        vector_rate = vectorized[key] / n
+        error = ((engine_rate * (1 - engine_rate) + vector_rate * (1 - vector_rate)) / n) ** 0.5
+        assert abs(engine_rate - vector_rate) < 4 * error, key
+
+
+def test_policy_table_follows_the_policy():
+    table = vector_sim.policy_table(lambda total, soft, upcard: total < 12 or (soft and upcard == 10))
+    assert table[11, 0, 2] and not table[12, 0, 10]
+    assert table[18, 1, 10] and not table[18, 1, 9]
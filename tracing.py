@@ -0,0 +1,162 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+
+# This lists the trace levels, lowest first
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS_BY_NAME = {name.lower(): level for level, name in LEVEL_NAMES.items()}
+
+# This sets the recording level from the environment, e.g. ZA21_TRACE=debug
+TRACE_ENV = "ZA21_TRACE"
+# This is how many events the ring buffer keeps
+RING_SIZE = 2048
+
+
+class TraceEvent:
+    """One recorded event. The message is only formatted when the event is read."""
+
+    __slots__ = ('time', 'level', 'message', 'args', 'action', 'round_id', 'duration')
+
+    def __init__(self, timestamp, level, message, args, action, round_id, duration):
+        self.time = timestamp
+        self.level = level
+        self.message = message
+        self.args = args
+        self.action = action  # str or None
+        self.round_id = round_id  # int or None
+        self.duration = duration  # seconds as float, or None
+
+    @property
+    def text(self):
+        return self.message % self.args if self.args else self.message
+
+    def format(self):
+        """One-line rendering of the event, with its typed fields."""
+        fields = ""
+        if self.action is not None:
+            fields += f" action={self.action}"
+        if self.round_id is not None:
+            fields += f" round={self.round_id}"
+        if self.duration is not None:
+            fields += f" duration_ms={self.duration * 1000:.3f}"
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.time)) + f".{int(self.time % 1 * 1000):03d}"
+        return f"{stamp} {LEVEL_NAMES.get(self.level, self.level):7} {self.text}{fields}"
+
+
+class _NoSpan:
+    """Span returned when tracing is off for the level; entering and leaving it does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    def __init__(self, tracer, level, message, args, action, round_id):
+        self.tracer = tracer
+        self.level = level
+        self.message = message
+        self.args = args
+        self.action = action
+        self.round_id = round_id
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.event(self.level, self.message, *self.args, action=self.action, round_id=self.round_id,
+                          duration=time.perf_counter() - self.start)
+        return False
+
+
+class Tracer:
+    """Leveled event tracing into a ring buffer. We created this class to replace print() on the UI paths.
+
+    Events below `level` are dropped by a single comparison and their message is never formatted.
+    Recorded events are kept in a bounded deque, so memory stays flat however long the app runs;
+    dump() writes them out on demand, and install_crash_handler() does so when the app crashes.
+    Events at `echo_level` or above are also written to stderr as they happen.
+    """
+
+    def __init__(self, level=INFO, capacity=RING_SIZE, echo_level=WARNING, stream=None):
+        self.level = level
+        self.echo_level = echo_level
+        self.stream = stream
+        self.events = deque(maxlen=capacity)
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def event(self, level, message, *args, action=None, round_id=None, duration=None):
+        """Record an event; `message` is a %-format string filled from `args` only when read."""
+        if level < self.level:
+            return
+        event = TraceEvent(time.time(), level, message, args, action, round_id, duration)
+        # deque.append is atomic, so the writer threads can trace too
+        self.events.append(event)
+        if level >= self.echo_level:
+            print(event.format(), file=self.stream or sys.stderr)
+
+    def debug(self, message, *args, **fields):
+        if DEBUG >= self.level:
+            self.event(DEBUG, message, *args, **fields)
+
+    def info(self, message, *args, **fields):
+        if INFO >= self.level:
+            self.event(INFO, message, *args, **fields)
+
+    def warning(self, message, *args, **fields):
+        self.event(WARNING, message, *args, **fields)
+
+    def error(self, message, *args, **fields):
+        self.event(ERROR, message, *args, **fields)
+
+    def span(self, message, *args, action=None, round_id=None, level=DEBUG):
+        """Context manager that records one event with the duration of its block."""
+        if level < self.level:
+            return _NO_SPAN
+        return _Span(self, level, message, args, action, round_id)
+
+    def dump(self, stream=None):
+        """Write every buffered event, oldest first, to `stream` (stderr by default)."""
+        stream = stream or sys.stderr
+        for event in list(self.events):
+            stream.write(event.format() + "\n")
+        stream.flush()
+
+    def install_crash_handler(self):
+        """Dump the ring buffer before an uncaught exception (main or other threads) is reported."""
+        previous_hook = sys.excepthook
+        previous_thread_hook = threading.excepthook
+
+        def excepthook(exc_type, exc_value, exc_traceback):
+            self.event(ERROR, "Uncaught %s: %s", exc_type.__name__, exc_value)
+            self.dump()
+            previous_hook(exc_type, exc_value, exc_traceback)
+
+        def thread_excepthook(args):
+            self.event(ERROR, "Uncaught %s in thread %s: %s", args.exc_type.__name__,
+                       args.thread.name if args.thread else "?", args.exc_value)
+            self.dump()
+            previous_thread_hook(args)
+
+        sys.excepthook = excepthook
+        threading.excepthook = thread_excepthook
+
+
+# This is the tracer the app's modules share; setting ZA21_TRACE also echoes that level to stderr
+_env_level = LEVELS_BY_NAME.get(os.environ.get(TRACE_ENV, "").lower())
+tracer = Tracer(_env_level or INFO, echo_level=min(_env_level or WARNING, WARNING))
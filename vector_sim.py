@@ -0,0 +1,175 @@
+import numpy as np
+
+from game_logic import RANKS, RuleSet, mimic_dealer_policy, new_round_stats, merge_round_stats
+
+
+# This maps rank codes (indexes into RANKS) to hard values, Aces counting 1
+RANK_HARD_VALUES = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10], dtype=np.int16)
+ACE = 0
+
+
+def policy_table(policy=mimic_dealer_policy):
+    """Tabulate a Game21.play_rounds() policy into a boolean hit table.
+
+    The table is indexed [player total, soft flag, dealer upcard value] with the upcard counted
+    as 11 for an Ace, so a policy written for the batch engine can drive the vectorized one.
+    Only hit or stand is tabulated: DOUBLE and SURRENDER are played as a hit.
+    """
+    table = np.zeros((22, 2, 12), dtype=bool)
+    for total in range(4, 22):
+        for soft in (False, True):
+            for upcard in range(2, 12):
+                table[total, int(soft), upcard] = bool(policy(total, soft, upcard))
+    return table
+
+
+def check_rules(rules):
+    """Raise ValueError for rules this backend cannot play: it has no doubling or surrender."""
+    if rules.double_on != 'none' or rules.surrender:
+        raise ValueError("the numpy backend does not simulate doubling or surrender; use the engine backend")
+
+
+class _ShoeSampler:
+    """Deals from one freshly shuffled shoe per hand, tracked as per-rank counts."""
+
+    def __init__(self, n, num_decks, rng):
+        self.per_rank = 4 * num_decks
+        self.counts = np.full((n, len(RANKS)), self.per_rank, dtype=np.int16)
+        self.rng = rng
+
+    def draw(self, rows):
+        """Draw one card without replacement for each hand index in `rows`; returns rank codes."""
+        ranks = np.empty(rows.size, dtype=np.intp)
+        pending = np.arange(rows.size)
+        # This picks a card slot (rank, copy) from the full shoe and retries if that copy was dealt,
+        # which gives each remaining card the same chance without a per-row cumulative sum
+        while pending.size:
+            rank = self.rng.integers(0, len(RANKS), pending.size)
+            copy = self.rng.integers(0, self.per_rank, pending.size)
+            accepted = copy < self.counts[rows[pending], rank]
+            ranks[pending[accepted]] = rank[accepted]
+            pending = pending[~accepted]
+        self.counts[rows, ranks] -= 1
+        return ranks
+
+
+def play_hands(n, table, rules=None, rng=None):
+    """Play n independent rounds at once and return per-hand NumPy arrays.
+
+    Each hand is dealt from its own freshly shuffled shoe of `rules.num_decks` decks, in the same
+    order as Game21.deal_initial_cards() (player, dealer up, player, dealer hole). The player hits
+    while `table` says so, the dealer follows the rule set's S17/H17 rule and the comparison follows
+    Game21.determine_winner().
+
+    Returns a dict with 'outcome' (+1 win, 0 push, -1 loss), 'natural' and 'player_bust' flags,
+    'dealer_total' (the dealer's final total, 0 where the dealer did not play) and 'net' (the return
+    in bet units, with the rule set's blackjack payout).
+    """
+    rules = RuleSet() if rules is None else rules
+    check_rules(rules)
+    rng = np.random.default_rng() if rng is None else rng
+    shoe = _ShoeSampler(n, rules.num_decks, rng)
+    every_hand = np.arange(n)
+
+    # This deals the initial four cards to every hand
+    player_1 = shoe.draw(every_hand)
+    upcard = shoe.draw(every_hand)
+    player_2 = shoe.draw(every_hand)
+    hole = shoe.draw(every_hand)
+
+    player_hard = RANK_HARD_VALUES[player_1] + RANK_HARD_VALUES[player_2]
+    player_ace = (player_1 == ACE) | (player_2 == ACE)
+    dealer_hard = RANK_HARD_VALUES[upcard] + RANK_HARD_VALUES[hole]
+    dealer_ace = (upcard == ACE) | (hole == ACE)
+    upcard_value = np.where(upcard == ACE, 11, RANK_HARD_VALUES[upcard])
+
+    natural = player_ace & (player_hard == 11)
+    dealer_natural = dealer_ace & (dealer_hard == 11)
+
+    # This runs the player's turn for every hand that is still hitting
+    active = ~natural
+    while True:
+        soft = player_ace & (player_hard <= 11)
+        total = player_hard + 10 * soft
+        hitting = active & table[np.minimum(total, 21), soft.astype(np.intp), upcard_value]
+        rows = np.flatnonzero(hitting)
+        if rows.size == 0:
+            break
+        ranks = shoe.draw(rows)
+        player_hard[rows] += RANK_HARD_VALUES[ranks]
+        player_ace[rows] |= ranks == ACE
+        active = hitting & (player_hard <= 21)
+
+    player_bust = player_hard > 21
+    player_total = player_hard + 10 * (player_ace & (player_hard <= 11))
+
+    # This runs the dealer's turn (hit below 17, and on soft 17 under H17) for hands that are still live
+    dealer_plays = ~natural & ~player_bust
+    while True:
+        dealer_total = dealer_hard + 10 * (dealer_ace & (dealer_hard <= 11))
+        dealer_hits = dealer_total < 17
+        if rules.dealer_hits_soft_17:
+            dealer_hits |= (dealer_total == 17) & (dealer_hard < 17)
+        rows = np.flatnonzero(dealer_plays & dealer_hits)
+        if rows.size == 0:
+            break
+        ranks = shoe.draw(rows)
+        dealer_hard[rows] += RANK_HARD_VALUES[ranks]
+        dealer_ace[rows] |= ranks == ACE
+
+    # This compares the hands like Game21.determine_winner()
+    outcome = np.sign(player_total - dealer_total).astype(np.int8)
+    outcome[dealer_total > 21] = 1
+    outcome[player_bust] = -1
+    outcome[natural] = np.where(dealer_natural[natural], 0, 1)
+    net = outcome.astype(np.float64)
+    net[natural & ~dealer_natural] = rules.blackjack_payout
+
+    return {
+        'outcome': outcome,
+        'natural': natural,
+        'player_bust': player_bust,
+        'dealer_total': np.where(dealer_plays, dealer_total, 0).astype(np.int16),
+        'net': net,
+    }
+
+
+def summarize(hands):
+    """Collapse the per-hand arrays from play_hands() into new_round_stats() counters."""
+    stats = new_round_stats()
+    outcome = hands['outcome']
+    dealer_total = hands['dealer_total']
+    stats['rounds'] = int(outcome.size)
+    stats['wins'] = int(np.count_nonzero(outcome == 1))
+    stats['losses'] = int(np.count_nonzero(outcome == -1))
+    stats['pushes'] = int(np.count_nonzero(outcome == 0))
+    stats['blackjacks'] = int(np.count_nonzero(hands['natural']))
+    stats['player_busts'] = int(np.count_nonzero(hands['player_bust']))
+    stats['dealer_busts'] = int(np.count_nonzero(dealer_total > 21))
+    stats['net'] = float(hands['net'].sum())
+    stats['wagered'] = float(outcome.size)
+    totals = np.bincount(dealer_total, minlength=22)
+    for total in stats['dealer_totals']:
+        stats['dealer_totals'][total] = int(totals[total])
+    return stats
+
+
+def simulate(n, policy=mimic_dealer_policy, rules=None, rng=None, chunk_size=1 << 20):
+    """Play n rounds vectorized and return the same counters as Game21.play_rounds().
+
+    Rounds are processed in chunks of `chunk_size` to bound memory. Because every hand is dealt from
+    a fresh shoe, results match Game21 dealing to its cut card up to the small cut-card effect.
+    Doubling and surrender are not simulated here, so rules that allow them raise ValueError;
+    use the engine backend for those rules.
+    """
+    rules = RuleSet() if rules is None else rules
+    check_rules(rules)
+    rng = np.random.default_rng() if rng is None else rng
+    table = policy if isinstance(policy, np.ndarray) else policy_table(policy)
+    stats = new_round_stats()
+    remaining = n
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        merge_round_stats(stats, summarize(play_hands(size, table, rules, rng)))
+        remaining -= size
+    return stats
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
+from tracing import tracer
 
 
 class WelcomePage(QWidget):
@@ -249,5 +250,5 @@ class WelcomePage(QWidget):
     def start_game(self):
         """Switch to game page"""
         if self.parent_window:
-            print(" Starting game...")
+            tracer.info("Starting game", action="start_game")
             self.parent_window.show_game_page()
\ No newline at end of file